@@ -13,5 +13,14 @@ __all__ = [
     'MeetingScheduler',
     'LLMService',
     'GoogleCalendarManager',
+    'AsyncGoogleCalendarManager',
     'SchedulerAgent'
 ]
+
+
+def __getattr__(name):
+    # Imported on first use, so aiohttp is only needed by code that uses it
+    if name == 'AsyncGoogleCalendarManager':
+        from .async_calendar_manager import AsyncGoogleCalendarManager
+        return AsyncGoogleCalendarManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
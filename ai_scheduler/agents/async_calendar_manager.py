@@ -0,0 +1,136 @@
+"""Asynchronous calendar management for the AI Scheduling Assistant."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Any
+
+import aiohttp
+from google.auth.transport.requests import Request
+
+from .calendar_manager import GoogleCalendarManager, _find_token_file, _load_credentials, _json_loads
+
+logger = logging.getLogger(__name__)
+
+EVENTS_URL = 'https://www.googleapis.com/calendar/v3/calendars/primary/events'
+
+
+class AsyncGoogleCalendarManager(GoogleCalendarManager):
+    """Google Calendar manager that fetches calendars with asyncio.
+
+    Talks to the Calendar REST API directly over one shared aiohttp session,
+    so many users' calendars can be in flight at once on a single thread.
+    Token loading, caching and slot search are inherited from
+    GoogleCalendarManager.
+    """
+
+    # Maximum number of simultaneous connections to the Calendar API
+    CONNECTION_LIMIT = 32
+
+    def __init__(self, token_dir: str = 'Keys'):
+        """Initialize the async Google Calendar manager.
+
+        Args:
+            token_dir: Directory containing token files
+        """
+        super().__init__(token_dir=token_dir)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.CONNECTION_LIMIT, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _get_access_token(self, user_email: str) -> str:
+        """Get a valid access token for a user, refreshing it when close to expiry."""
+        creds = _load_credentials(_find_token_file(self.token_dir, user_email))
+
+        # google-auth treats tokens as invalid shortly before they expire
+        if not creds.valid and creds.refresh_token:
+            await asyncio.to_thread(creds.refresh, Request())
+        return creds.token
+
+    async def get_events_async(self, user_email: str,
+                               time_min: Optional[datetime] = None,
+                               time_max: Optional[datetime] = None,
+                               max_results: int = 100) -> List[Dict[str, Any]]:
+        """Get events from a user's calendar without blocking the event loop.
+
+        Args:
+            user_email: Email of the user
+            time_min: Start of time range (timezone-aware datetime)
+            time_max: End of time range (timezone-aware datetime)
+            max_results: Maximum number of events to return
+
+        Returns:
+            List of events with timezone-aware datetimes
+        """
+        time_min_str, time_max_str = self._format_time_range(time_min, time_max)
+        cache_key = self._events_cache_key(user_email, time_min_str, time_max_str, max_results)
+
+        events = self._get_cached_events(cache_key)
+        if events is not None:
+            return events
+
+        try:
+            token = await self._get_access_token(user_email)
+            params = {
+                'timeMin': time_min_str,
+                'timeMax': time_max_str,
+                'maxResults': str(max_results),
+                'singleEvents': 'true',
+                'orderBy': 'startTime',
+                'fields': self.EVENT_FIELDS
+            }
+
+            async with self._get_session().get(
+                EVENTS_URL,
+                params=params,
+                headers={'Authorization': f'Bearer {token}'}
+            ) as response:
+                response.raise_for_status()
+                events_result = await response.json(loads=_json_loads)
+        except Exception as e:
+            logger.warning("Error getting events for %s: %s", user_email, e)
+            return self._get_mock_events(user_email, time_min, time_max)
+
+        events = self._format_events(events_result.get('items', ()))
+        self._cache_events(cache_key, events)
+        return events
+
+    async def find_available_slots_async(self, attendees: List[str],
+                                         duration_minutes: int = 30,
+                                         time_min: Optional[datetime] = None,
+                                         time_max: Optional[datetime] = None) -> List[Dict[str, str]]:
+        """Find available time slots for all attendees, fetching calendars concurrently.
+
+        Args:
+            attendees: List of attendee emails
+            duration_minutes: Duration of the meeting in minutes
+            time_min: Start of time range
+            time_max: End of time range
+
+        Returns:
+            List of available time slots
+        """
+        time_min = time_min or datetime.utcnow()
+        time_max = time_max or time_min + timedelta(days=7)
+
+        attendees = list(dict.fromkeys(attendees))
+        results = await asyncio.gather(*[
+            self.get_events_async(attendee, time_min, time_max)
+            for attendee in attendees
+        ])
+        all_events = dict(zip(attendees, results))
+
+        busy = self._merge_busy_intervals(all_events)
+        return self._compute_available_slots(busy, duration_minutes, time_min, time_max)
@@ -2,22 +2,279 @@
 
 import os
 import json
-import pickle
+import logging
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Optional, Any
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Optional, Any, Tuple, Iterable, Iterator
 
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest
+from googleapiclient.model import JsonModel
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
+
+try:
+    # C implementation, roughly 10x faster than the standard library parser
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    # Python 3.11+ accepts the 'Z' suffix natively
+    _parse_iso = datetime.fromisoformat
+
+try:
+    # C implementation that parses large event lists several times faster
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 from ..models.schemas import Event, TimeSlot, Attendee
 
+logger = logging.getLogger(__name__)
+
+_thread_local = threading.local()
+
+
+@lru_cache(maxsize=128)
+def _find_token_file(token_dir: str, user_email: str) -> str:
+    """Resolve the token file for a user.
+    
+    Args:
+        token_dir: Directory containing token files
+        user_email: Email of the user (e.g., user@example.com or just 'user')
+        
+    Returns:
+        Path to the first matching token file
+    """
+    # Try different token file name formats
+    username = user_email.split('@')[0]  # Get the part before @
+    possible_token_files = [
+        os.path.join(token_dir, f"{user_email}.token"),  # Full email
+        os.path.join(token_dir, f"{username}.token"),    # Just the username
+        os.path.join(token_dir, "token.json"),           # Generic token
+    ]
+    
+    for path in possible_token_files:
+        if os.path.exists(path):
+            return path
+    
+    raise FileNotFoundError(
+        f"No token file found. Tried: {', '.join(possible_token_files)}"
+    )
+
+
+@lru_cache(maxsize=128)
+def _load_credentials(token_path: str) -> Credentials:
+    """Load authorized user credentials from a token file, once per path."""
+    try:
+        # Parse the token ourselves, with orjson when it is installed
+        with open(token_path, 'rb') as f:
+            token_data = _json_loads(f.read())
+        return Credentials.from_authorized_user_info(token_data)
+    except Exception as e:
+        logger.error("Error loading credentials from %s: %s", token_path, e)
+        raise
+
+
+def _thread_http() -> httplib2.Http:
+    """Get the calling thread's persistent HTTP transport.
+    
+    httplib2 keeps connections alive between requests but is not
+    thread-safe, so each thread gets one transport shared by all users.
+    """
+    http = getattr(_thread_local, 'http', None)
+    if http is None:
+        http = _thread_local.http = httplib2.Http(timeout=30)
+    return http
+
+
+class _FastJsonModel(JsonModel):
+    """JSON model that parses API responses with the fastest available parser."""
+    
+    def deserialize(self, content):
+        try:
+            body = _json_loads(content)
+        except ValueError:
+            # Not JSON; hand back the text like the stock model does
+            return content.decode('utf-8') if isinstance(content, bytes) else content
+        if self._data_wrapper and 'data' in body:
+            body = body['data']
+        return body
+
+
+@lru_cache(maxsize=128)
+def _build_service(token_path: str):
+    """Build the Google Calendar service for a token file, once per path.
+    
+    Requests made through the service run on the calling thread's pooled
+    transport, which makes the cached service safe to share across threads.
+    """
+    creds = _load_credentials(token_path)
+    
+    def request_builder(http, *args, **kwargs):
+        return HttpRequest(AuthorizedHttp(creds, http=_thread_http()), *args, **kwargs)
+    
+    # Use the discovery document bundled with the client library so building
+    # a service never makes an HTTP request of its own
+    return build(
+        'calendar', 'v3',
+        credentials=creds,
+        model=_FastJsonModel(),
+        requestBuilder=request_builder,
+        static_discovery=True,
+        cache_discovery=False
+    )
+
+
+def _to_timestamp(dt: datetime) -> int:
+    """Convert a datetime to epoch seconds, treating naive values as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _merge_intervals(intervals: Iterable[Tuple[int, int]]) -> Tuple[array, array]:
+    """Merge (start, end) epoch-second intervals into sorted, non-overlapping ones.
+    
+    Returns:
+        Tuple of (starts, ends) arrays, sorted by start
+    """
+    starts = array('q')
+    ends = array('q')
+    for start, end in sorted(intervals):
+        if ends and start <= ends[-1]:
+            if end > ends[-1]:
+                ends[-1] = end
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def _free_slot_starts(busy_starts: array, busy_ends: array, first: int, last: int,
+                      step: int, duration: int) -> Iterator[int]:
+    """Yield the grid points ``first, first + step, ... <= last`` that are free.
+    
+    A start is free when ``[start, start + duration)`` misses every busy
+    interval. Rather than testing each grid point, walk the gaps between the
+    busy intervals and emit each gap's grid points as a single range.
+    
+    Args:
+        busy_starts: Sorted start times of non-overlapping busy intervals
+        busy_ends: Matching end times, also sorted
+        first: First grid point, in epoch seconds
+        last: Last grid point, in epoch seconds
+        step: Grid spacing in seconds
+        duration: Slot length in seconds
+    """
+    # First busy interval that ends after the grid begins
+    index = bisect_right(busy_ends, first)
+    gap_start = first
+    
+    while gap_start <= last:
+        if index == len(busy_starts):
+            yield from range(gap_start, last + 1, step)
+            return
+        
+        latest_start = min(last, busy_starts[index] - duration)
+        if latest_start >= gap_start:
+            yield from range(gap_start, latest_start + 1, step)
+        
+        # Resume at the first grid point after this busy interval ends
+        gap_start = max(gap_start, first - (first - busy_ends[index]) // step * step)
+        index += 1
+
+
+# Mock calendars used when real calendar data is not available. For the
+# specific test case these are the exact events from the expected output
+# (Thursday July 24, 2025).
+_TEAM_ATTENDEES = [
+    "userone.amd@gmail.com",
+    "usertwo.amd@gmail.com",
+    "userthree.amd@gmail.com"
+]
+
+_TEAM_MEET = {
+    "StartTime": "2025-07-24T10:00:00+05:30",
+    "EndTime": "2025-07-24T10:30:00+05:30",
+    "NumAttendees": 3,
+    "Attendees": _TEAM_ATTENDEES,
+    "Summary": "Team Meet"
+}
+
+_STATUS_UPDATE = {
+    "StartTime": "2025-07-24T10:30:00+05:30",
+    "EndTime": "2025-07-24T11:00:00+05:30",
+    "NumAttendees": 3,
+    "Attendees": _TEAM_ATTENDEES,
+    "Summary": "Agentic AI Project Status Update"
+}
+
+_CUSTOMER_LUNCH = {
+    "StartTime": "2025-07-24T13:00:00+05:30",
+    "EndTime": "2025-07-24T14:00:00+05:30",
+    "NumAttendees": 1,
+    "Attendees": ["SELF"],
+    "Summary": "Lunch with Customers"
+}
+
+_MOCK_EVENTS_BY_USER = {
+    "userone.amd@gmail.com": (_STATUS_UPDATE,),
+    "usertwo.amd@gmail.com": (_TEAM_MEET, _STATUS_UPDATE),
+    "userthree.amd@gmail.com": (_TEAM_MEET, _CUSTOMER_LUNCH, _STATUS_UPDATE),
+}
+
+# For any other user, a generic event
+_DEFAULT_MOCK_EVENTS = (
+    {
+        "StartTime": "2025-07-24T09:00:00+05:30",
+        "EndTime": "2025-07-24T09:30:00+05:30",
+        "NumAttendees": 1,
+        "Attendees": ["SELF"],
+        "Summary": "Daily Standup"
+    },
+)
+
+
 class GoogleCalendarManager:
     """Manages Google Calendar API interactions."""
     
     SCOPES = ['https://www.googleapis.com/auth/calendar']
     
+    # Maximum number of calls the Calendar API accepts in one batch request
+    BATCH_LIMIT = 50
+    
+    # Maximum number of calendars the Calendar API accepts in one freebusy query
+    FREEBUSY_LIMIT = 50
+    
+    # Upper bound on threads used when calendars are fetched concurrently
+    MAX_WORKERS = 16
+    
+    # Maximum number of per-user services kept in ``self.services``
+    MAX_SERVICES = 128
+    
+    # Only the event fields used by _format_events are requested from the API
+    EVENT_FIELDS = 'items(start(dateTime,date),end(dateTime,date),attendees/email,summary),nextPageToken'
+    
+    # Seconds for which fetched events are reused for the same user and time range
+    EVENTS_CACHE_TTL = 60
+    
+    # Maximum number of (user, time range) entries kept in the events cache
+    EVENTS_CACHE_SIZE = 1024
+    
+    # Seconds for which a user's busy intervals on a given day are reused
+    BUSY_CACHE_TTL = 180
+    
+    # Maximum number of (user, day) entries kept in the busy cache
+    BUSY_CACHE_SIZE = 10_000
+    
     def __init__(self, token_dir: str = 'Keys'):
         """Initialize the Google Calendar manager.
         
@@ -25,72 +282,72 @@ class GoogleCalendarManager:
             token_dir: Directory containing token files
         """
         self.token_dir = token_dir
-        self.services = {}
-        try:
-            self.load_all_credentials()
-        except Exception as e:
-            print(f"Warning: Could not load credentials: {e}")
+        self.services = OrderedDict()
+        self._services_lock = threading.Lock()
+        self._events_cache = OrderedDict()
+        self._events_cache_lock = threading.Lock()
+        self._busy_cache = OrderedDict()
+        self._busy_cache_lock = threading.Lock()
     
     def load_all_credentials(self):
-        """Load credentials for all users from token files."""
+        """Load credentials for all users from token files.
+        
+        Services are otherwise built on demand by ``_ensure_service``; call
+        this to pay the cost of building them all up front instead.
+        """
         if not os.path.exists(self.token_dir):
-            print(f"Warning: Token directory {self.token_dir} not found")
+            logger.warning("Token directory %s not found", self.token_dir)
             return
         
         for filename in os.listdir(self.token_dir):
             if filename.endswith('.token'):
                 try:
                     user_email = filename.replace('.token', '')
-                    self.services[user_email] = self.get_service_for_user(user_email)
-                    print(f"Loaded credentials for {user_email}")
+                    self._ensure_service(user_email)
+                    logger.debug("Loaded credentials for %s", user_email)
                 except Exception as e:
-                    print(f"Error loading credentials for {filename}: {e}")
+                    logger.error("Error loading credentials for %s: %s", filename, e)
     
     def get_service_for_user(self, user_email: str):
         """Get Google Calendar service for a specific user.
         
+        Services are built once per token file and reused; expired
+        credentials are refreshed in place rather than rebuilding the service.
+        
         Args:
             user_email: Email of the user (e.g., user@example.com or just 'user')
             
         Returns:
             Google Calendar service
         """
-        # Try different token file name formats
-        username = user_email.split('@')[0]  # Get the part before @
-        possible_token_files = [
-            os.path.join(self.token_dir, f"{user_email}.token"),  # Full email
-            os.path.join(self.token_dir, f"{username}.token"),    # Just the username
-            os.path.join(self.token_dir, "token.json"),           # Generic token
-        ]
+        token_path = _find_token_file(self.token_dir, user_email)
+        logger.debug("Using token file: %s", token_path)
         
-        token_path = None
-        for path in possible_token_files:
-            if os.path.exists(path):
-                token_path = path
-                break
-                
-        if not token_path:
-            raise FileNotFoundError(
-                f"No token file found. Tried: {', '.join(possible_token_files)}"
-            )
-            
-        print(f"Using token file: {os.path.basename(token_path)}")
+        creds = _load_credentials(token_path)
+        if creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        return _build_service(token_path)
+    
+    def _ensure_service(self, user_email: str):
+        """Get the cached service for a user, building it on first use.
         
-        try:
-            # Use the same approach as the working notebook
-            creds = Credentials.from_authorized_user_file(token_path)
-            return build('calendar', 'v3', credentials=creds)
-        except Exception as e:
-            print(f"Error creating service with direct file load: {e}")
-            # Fall back to manual token loading
-            try:
-                with open(token_path, 'r') as f:
-                    token_data = json.load(f)
-                creds = Credentials.from_authorized_user_info(token_data)
-                return build('calendar', 'v3', credentials=creds)
-            except Exception as e2:
-                print(f"Also failed with manual token loading: {e2}")
-                raise e2
+        ``self.services`` is kept as an LRU of at most MAX_SERVICES entries.
+        """
+        with self._services_lock:
+            service = self.services.get(user_email)
+            if service is not None:
+                self.services.move_to_end(user_email)
+                return service
+        
+        logger.debug("Loading service for %s", user_email)
+        service = self.get_service_for_user(user_email)
+        
+        with self._services_lock:
+            self.services[user_email] = service
+            self.services.move_to_end(user_email)
+            while len(self.services) > self.MAX_SERVICES:
+                self.services.popitem(last=False)
+        return service
     
     def get_events(self, user_email: str, 
                   time_min: Optional[datetime] = None, 
@@ -107,208 +364,277 @@ class GoogleCalendarManager:
         Returns:
             List of events with timezone-aware datetimes
         """
+        time_min_str, time_max_str = self._format_time_range(time_min, time_max)
+        cache_key = self._events_cache_key(user_email, time_min_str, time_max_str, max_results)
+        
+        events = self._get_cached_events(cache_key)
+        if events is not None:
+            return events
+        
         try:
-            if user_email not in self.services:
-                print(f"Loading service for {user_email}")
-                self.services[user_email] = self.get_service_for_user(user_email)
-            
-            service = self.services[user_email]
-            
-            # Ensure timezone-aware datetimes
-            now_utc = datetime.now(timezone.utc)
-            
-            # Handle time_min
-            if time_min is None:
-                time_min = now_utc
-            elif time_min.tzinfo is None:
-                time_min = time_min.replace(tzinfo=timezone.utc)
-                
-            # Handle time_max (default to 7 days from now if not provided)
-            if time_max is None:
-                time_max = now_utc + timedelta(days=7)
-            elif time_max.tzinfo is None:
-                time_max = time_max.replace(tzinfo=timezone.utc)
-            
-            # Ensure time_max is after time_min
-            if time_max <= time_min:
-                time_max = time_min + timedelta(hours=1)
-            
-            # Format for API (must be in RFC3339 format with Z suffix)
-            # Convert to UTC first to avoid timezone issues
-            time_min_utc = time_min.astimezone(timezone.utc)
-            time_max_utc = time_max.astimezone(timezone.utc)
-            
-            # Format as RFC3339 with Z suffix (required by Google Calendar API)
-            time_min_str = time_min_utc.strftime('%Y-%m-%dT%H:%M:%SZ')
-            time_max_str = time_max_utc.strftime('%Y-%m-%dT%H:%M:%SZ')
+            service = self._ensure_service(user_email)
             
             # For debugging
-            print(f"Fetching events from {time_min_str} to {time_max_str}")
+            logger.debug("Fetching events from %s to %s", time_min_str, time_max_str)
             
             # Make the API call
             try:
-                events_result = service.events().list(
-                    calendarId='primary',
-                    timeMin=time_min_str,
-                    timeMax=time_max_str,
-                    maxResults=max_results,
-                    singleEvents=True,
-                    orderBy='startTime'
+                events_result = self._list_events_request(
+                    service, time_min_str, time_max_str, max_results
                 ).execute()
             except Exception as e:
                 # If we get an error, try with mock data
-                print(f"Error getting events from API: {e}")
+                logger.warning("Error getting events from API for %s: %s", user_email, e)
                 return self._get_mock_events(user_email, time_min, time_max)
             
-            events = []
-            for event in events_result.get('items', []):
-                try:
-                    # Handle attendees
-                    attendee_list = []
-                    for attendee in event.get('attendees', []):
-                        attendee_list.append(attendee['email'])
-                    
-                    # Skip if no attendees (optional)
-                    if not attendee_list:
-                        attendee_list = ["SELF"]
-                    
-                    # Get start and end times
-                    start_time = event['start'].get('dateTime', event['start'].get('date'))
-                    end_time = event['end'].get('dateTime', event['end'].get('date'))
-                    
-                    events.append({
-                        "StartTime": start_time,
-                        "EndTime": end_time,
-                        "NumAttendees": len(set(attendee_list)),
-                        "Attendees": list(set(attendee_list)),
-                        "Summary": event.get('summary', 'No Title')
-                    })
-                except Exception as e:
-                    print(f"Error processing event: {e}")
-                    continue
-                    
+            events = self._format_events(events_result.get('items', ()))
+            self._cache_events(cache_key, events)
             return events
             
         except Exception as e:
-            print(f"Error getting events for {user_email}: {e}")
+            logger.warning("Error getting events for %s: %s", user_email, e)
             # Return mock data only if explicitly configured to do so
             return self._get_mock_events(user_email, time_min, time_max)
     
-    def find_available_slots(self, attendees: List[str], duration_minutes: int, time_min: datetime, time_max: datetime) -> List[Dict[str, Any]]:
-        """Find available time slots for a meeting with the given attendees.
+    def _events_cache_key(self, user_email: str, time_min_str: str,
+                          time_max_str: str, max_results: int) -> Tuple[str, str, str, int]:
+        """Build the events cache key, with the time range rounded to the minute."""
+        return (user_email, time_min_str[:16], time_max_str[:16], max_results)
+    
+    def _get_cached_events(self, cache_key: Tuple[str, str, str, int]) -> Optional[List[Dict[str, Any]]]:
+        """Get a copy of cached events if they are younger than EVENTS_CACHE_TTL."""
+        with self._events_cache_lock:
+            entry = self._events_cache.get(cache_key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.EVENTS_CACHE_TTL:
+                del self._events_cache[cache_key]
+                return None
+            self._events_cache.move_to_end(cache_key)
+            return list(entry[1])
+    
+    def _cache_events(self, cache_key: Tuple[str, str, str, int], events: List[Dict[str, Any]]):
+        """Store a copy of freshly fetched events, evicting expired and least recently used entries.
+        
+        Keys include the minute-rounded time range, so old keys are rarely
+        looked up again and have to be evicted here.
+        """
+        now = time.monotonic()
+        with self._events_cache_lock:
+            self._events_cache[cache_key] = (now, list(events))
+            self._events_cache.move_to_end(cache_key)
+            while self._events_cache:
+                oldest = next(iter(self._events_cache.values()))
+                if (len(self._events_cache) <= self.EVENTS_CACHE_SIZE
+                        and now - oldest[0] <= self.EVENTS_CACHE_TTL):
+                    break
+                self._events_cache.popitem(last=False)
+    
+    def invalidate_events_cache(self, user_email: str):
+        """Drop all cached events for a user, e.g. after their calendar changed."""
+        with self._events_cache_lock:
+            for cache_key in [key for key in self._events_cache if key[0] == user_email]:
+                del self._events_cache[cache_key]
+        with self._busy_cache_lock:
+            for cache_key in [key for key in self._busy_cache if key[0] == user_email]:
+                del self._busy_cache[cache_key]
+    
+    def _get_cached_busy(self, user_email: str, day: int) -> Optional[Tuple[Tuple[int, int], ...]]:
+        """Get a user's cached busy intervals for a UTC day if younger than BUSY_CACHE_TTL."""
+        with self._busy_cache_lock:
+            entry = self._busy_cache.get((user_email, day))
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.BUSY_CACHE_TTL:
+                del self._busy_cache[(user_email, day)]
+                return None
+            self._busy_cache.move_to_end((user_email, day))
+            return entry[1]
+    
+    def _cache_busy(self, user_email: str, day: int, intervals: Tuple[Tuple[int, int], ...]):
+        """Store a user's busy intervals for a UTC day, evicting the oldest entries."""
+        with self._busy_cache_lock:
+            self._busy_cache[(user_email, day)] = (time.monotonic(), intervals)
+            self._busy_cache.move_to_end((user_email, day))
+            while len(self._busy_cache) > self.BUSY_CACHE_SIZE:
+                self._busy_cache.popitem(last=False)
+    
+    def _get_events_concurrently(self, user_emails: List[str],
+                                 time_min: Optional[datetime],
+                                 time_max: Optional[datetime],
+                                 max_results: int) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch several users' events in parallel, one request per thread.
+        
+        Used when the requests cannot be batched; each call spends nearly all
+        of its time waiting on the network, so the waits overlap.
+        """
+        all_events = {}
+        if not user_emails:
+            return all_events
+        
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(user_emails))) as executor:
+            futures = {
+                executor.submit(self.get_events, user_email, time_min, time_max, max_results): user_email
+                for user_email in user_emails
+            }
+            for future in as_completed(futures):
+                all_events[futures[future]] = future.result()
+        
+        return all_events
+    
+    def get_events_batch(self, user_emails: List[str],
+                         time_min: Optional[datetime] = None,
+                         time_max: Optional[datetime] = None,
+                         max_results: int = 100) -> Dict[str, List[Dict[str, Any]]]:
+        """Get events for several users with one batched HTTP request.
+        
+        Queues one ``events().list`` call per user and executes them together,
+        so fetching N calendars costs a single round trip instead of N.
         
         Args:
-            attendees: List of attendee emails
-            duration_minutes: Duration of the meeting in minutes
-            time_min: Start of the time range to search
-            time_max: End of the time range to search
+            user_emails: Emails of the users
+            time_min: Start of time range (timezone-aware datetime)
+            time_max: End of time range (timezone-aware datetime)
+            max_results: Maximum number of events to return per user
             
         Returns:
-            List of available time slots
+            Dict mapping each user email to its list of events
         """
-        # Get events for all attendees
-        attendee_events = {}
-        for attendee in attendees:
-            events = self.get_events(attendee, time_min, time_max)
-            attendee_events[attendee] = events
-            
-        # Find available slots
-        available_slots = []
-        slot_duration = timedelta(minutes=duration_minutes)
-        
-        # Business hours: 9 AM to 5 PM
-        business_start_hour = 9
-        business_end_hour = 17
-        
-        # Check each day in the range
-        current_day = time_min.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_day = time_max.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        while current_day <= end_day:
-            # Skip weekends
-            if current_day.weekday() >= 5:  # 5 = Saturday, 6 = Sunday
-                current_day += timedelta(days=1)
+        time_min_str, time_max_str = self._format_time_range(time_min, time_max)
+        all_events = {}
+        
+        # Users whose service cannot be loaded get mock data, as in get_events
+        services = {}
+        for user_email in dict.fromkeys(user_emails):
+            events = self._get_cached_events(
+                self._events_cache_key(user_email, time_min_str, time_max_str, max_results)
+            )
+            if events is not None:
+                all_events[user_email] = events
                 continue
-                
-            # Start at 9 AM
-            slot_start = current_day.replace(hour=business_start_hour, minute=0)
             
-            # End at 5 PM
-            day_end = current_day.replace(hour=business_end_hour, minute=0)
-            
-            while slot_start + slot_duration <= day_end:
-                slot_end = slot_start + slot_duration
-                
-                # Check if slot works for all attendees
-                slot_available = True
-                
-                for attendee, events in attendee_events.items():
-                    for event in events:
-                        event_start = datetime.fromisoformat(event['StartTime'].replace('Z', '+00:00'))
-                        event_end = datetime.fromisoformat(event['EndTime'].replace('Z', '+00:00'))
-                        
-                        # Check for overlap
-                        if (slot_start < event_end and slot_end > event_start):
-                            slot_available = False
-                            break
-                    
-                    if not slot_available:
-                        break
-                
-                if slot_available:
-                    available_slots.append({
-                        "start_time": slot_start,
-                        "end_time": slot_end
-                    })
-                
-                # Move to next 30-minute slot
-                slot_start += timedelta(minutes=30)
+            try:
+                services[user_email] = self._ensure_service(user_email)
+            except Exception as e:
+                logger.warning("Error getting events for %s: %s", user_email, e)
+                all_events[user_email] = self._get_mock_events(user_email, time_min, time_max)
+        
+        def handle_response(request_id, response, exception):
+            if exception is not None:
+                logger.warning("Error getting events from API for %s: %s", request_id, exception)
+                all_events[request_id] = self._get_mock_events(request_id, time_min, time_max)
+            else:
+                all_events[request_id] = self._format_events(response.get('items', ()))
+                self._cache_events(
+                    self._events_cache_key(request_id, time_min_str, time_max_str, max_results),
+                    all_events[request_id]
+                )
+        
+        pending = list(services)
+        logger.debug("Fetching events for %d users from %s to %s", len(pending), time_min_str, time_max_str)
+        
+        for i in range(0, len(pending), self.BATCH_LIMIT):
+            chunk = pending[i:i + self.BATCH_LIMIT]
+            batch = services[chunk[0]].new_batch_http_request(callback=handle_response)
+            for user_email in chunk:
+                batch.add(
+                    self._list_events_request(
+                        services[user_email], time_min_str, time_max_str, max_results
+                    ),
+                    request_id=user_email
+                )
             
-            # Move to next day
-            current_day += timedelta(days=1)
+            try:
+                batch.execute()
+            except Exception as e:
+                logger.warning("Error executing batch request: %s", e)
+                all_events.update(self._get_events_concurrently(
+                    [user_email for user_email in chunk if user_email not in all_events],
+                    time_min, time_max, max_results
+                ))
         
-        return available_slots
+        return {user_email: all_events[user_email] for user_email in user_emails}
     
-    def create_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a calendar event.
+    def _list_events_request(self, service, time_min_str: str, time_max_str: str, max_results: int):
+        """Build an ``events().list`` request for a user's primary calendar."""
+        return service.events().list(
+            calendarId='primary',
+            timeMin=time_min_str,
+            timeMax=time_max_str,
+            maxResults=max_results,
+            singleEvents=True,
+            orderBy='startTime',
+            fields=self.EVENT_FIELDS
+        )
+    
+    def _format_time_range(self, time_min: Optional[datetime],
+                           time_max: Optional[datetime]) -> Tuple[str, str]:
+        """Normalize a time range and format it for the Calendar API.
         
         Args:
-            event_data: Event data including summary, description, start/end times, and attendees
+            time_min: Start of time range, defaults to now
+            time_max: End of time range, defaults to 7 days after now
             
         Returns:
-            Created event data
+            Tuple of (time_min, time_max) as RFC3339 strings with Z suffix
         """
-        try:
-            # Get the first attendee as the organizer
-            organizer_email = event_data['attendees'][0]['email'] if event_data['attendees'] else None
+        # Ensure timezone-aware datetimes
+        now_utc = datetime.now(timezone.utc)
+        
+        # Handle time_min
+        if time_min is None:
+            time_min = now_utc
+        elif time_min.tzinfo is None:
+            time_min = time_min.replace(tzinfo=timezone.utc)
             
-            if not organizer_email:
-                raise ValueError("No organizer specified for the event")
-                
-            # Get service for the organizer
-            service = self.get_service_for_user(organizer_email)
+        # Handle time_max (default to 7 days from now if not provided)
+        if time_max is None:
+            time_max = now_utc + timedelta(days=7)
+        elif time_max.tzinfo is None:
+            time_max = time_max.replace(tzinfo=timezone.utc)
+        
+        # Ensure time_max is after time_min
+        if time_max <= time_min:
+            time_max = time_min + timedelta(hours=1)
+        
+        # Format as RFC3339 with Z suffix (required by Google Calendar API)
+        # Convert to UTC first to avoid timezone issues
+        return (
+            time_min.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            time_max.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        )
+    
+    def _format_events(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Convert Calendar API event items into the output event format.
+        
+        Args:
+            items: Event resources returned by ``events().list``
             
-            if not service:
-                raise ValueError(f"Could not create service for {organizer_email}")
+        Returns:
+            List of events with start/end times, attendees and summary
+        """
+        events = []
+        for event in items:
+            try:
+                # Handle attendees, deduplicated once; "SELF" if there are none
+                attendee_set = {attendee['email'] for attendee in event.get('attendees', ())} or {"SELF"}
                 
-            # Create the event
-            event = service.events().insert(
-                calendarId='primary',
-                body=event_data,
-                sendUpdates='all'
-            ).execute()
-            
-            return event
-            
-        except Exception as e:
-            print(f"Error creating event: {e}")
-            # Return a mock event for testing
-            return {
-                "id": "mock_event_id",
-                "htmlLink": "https://calendar.google.com/calendar/event?eid=mock",
-                "status": "confirmed",
-                **event_data
-            }
+                # Get start and end times
+                start_time = event['start'].get('dateTime', event['start'].get('date'))
+                end_time = event['end'].get('dateTime', event['end'].get('date'))
+                
+                events.append({
+                    "StartTime": start_time,
+                    "EndTime": end_time,
+                    "NumAttendees": len(attendee_set),
+                    "Attendees": list(attendee_set),
+                    "Summary": event.get('summary', 'No Title')
+                })
+            except Exception as e:
+                logger.warning("Error processing event: %s", e)
+                continue
+                
+        return events
     
     def _get_mock_events(self, user_email: str, time_min: Optional[datetime] = None, time_max: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Generate mock events when real calendar data is not available.
@@ -321,80 +647,9 @@ class GoogleCalendarManager:
         Returns:
             List of mock events
         """
-        # For the specific test case, return the exact events from the expected output
-        # This is Thursday July 24, 2025
-        thursday = datetime(2025, 7, 24)
-        
-        # Common attendees for team meetings
-        team_attendees = [
-            "userone.amd@gmail.com",
-            "usertwo.amd@gmail.com",
-            "userthree.amd@gmail.com"
-        ]
-        
-        # Define mock events based on the user
-        if user_email == "userone.amd@gmail.com":
-            return [
-                {
-                    "StartTime": "2025-07-24T10:30:00+05:30",
-                    "EndTime": "2025-07-24T11:00:00+05:30",
-                    "NumAttendees": 3,
-                    "Attendees": team_attendees,
-                    "Summary": "Agentic AI Project Status Update"
-                }
-            ]
-        elif user_email == "usertwo.amd@gmail.com":
-            return [
-                {
-                    "StartTime": "2025-07-24T10:00:00+05:30",
-                    "EndTime": "2025-07-24T10:30:00+05:30",
-                    "NumAttendees": 3,
-                    "Attendees": team_attendees,
-                    "Summary": "Team Meet"
-                },
-                {
-                    "StartTime": "2025-07-24T10:30:00+05:30",
-                    "EndTime": "2025-07-24T11:00:00+05:30",
-                    "NumAttendees": 3,
-                    "Attendees": team_attendees,
-                    "Summary": "Agentic AI Project Status Update"
-                }
-            ]
-        elif user_email == "userthree.amd@gmail.com":
-            return [
-                {
-                    "StartTime": "2025-07-24T10:00:00+05:30",
-                    "EndTime": "2025-07-24T10:30:00+05:30",
-                    "NumAttendees": 3,
-                    "Attendees": team_attendees,
-                    "Summary": "Team Meet"
-                },
-                {
-                    "StartTime": "2025-07-24T13:00:00+05:30",
-                    "EndTime": "2025-07-24T14:00:00+05:30",
-                    "NumAttendees": 1,
-                    "Attendees": ["SELF"],
-                    "Summary": "Lunch with Customers"
-                },
-                {
-                    "StartTime": "2025-07-24T10:30:00+05:30",
-                    "EndTime": "2025-07-24T11:00:00+05:30",
-                    "NumAttendees": 3,
-                    "Attendees": team_attendees,
-                    "Summary": "Agentic AI Project Status Update"
-                }
-            ]
-        else:
-            # For any other user, return a generic event
-            return [
-                {
-                    "StartTime": "2025-07-24T09:00:00+05:30",
-                    "EndTime": "2025-07-24T09:30:00+05:30",
-                    "NumAttendees": 1,
-                    "Attendees": ["SELF"],
-                    "Summary": "Daily Standup"
-                }
-            ]
+        # Events are shared between calls; callers get a new list but must
+        # treat the event dicts themselves as read-only
+        return list(_MOCK_EVENTS_BY_USER.get(user_email, _DEFAULT_MOCK_EVENTS))
     
     def _parse_event_datetime(self, dt_dict: Dict[str, str]) -> str:
         """Parse event datetime from Google Calendar API format.
@@ -427,51 +682,141 @@ class GoogleCalendarManager:
         
         return [attendee.get('email', 'unknown') for attendee in attendees]
     
-    def create_event(self, user_email: str, event_data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_event(self, user_email: Optional[str], event_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new calendar event.
         
         Args:
-            user_email: Email of the user
+            user_email: Email of the organizer; defaults to the first attendee
             event_data: Event data in Google Calendar API format
             
         Returns:
             Created event data
         """
-        if user_email not in self.services:
-            print(f"No service available for user {user_email}, returning mock event")
-            return {
-                "Summary": event_data.get('summary', 'No Title'),
-                "StartTime": event_data.get('start', {}).get('dateTime', datetime.utcnow().isoformat()),
-                "EndTime": event_data.get('end', {}).get('dateTime', (datetime.utcnow() + timedelta(hours=1)).isoformat()),
-                "Attendees": [attendee.get('email') for attendee in event_data.get('attendees', [])],
-                "NumAttendees": len(event_data.get('attendees', [])) or 1
-            }
+        user_email = self._resolve_organizer(user_email, event_data)
         
         try:
-            service = self.services[user_email]
-            
-            event = service.events().insert(
-                calendarId='primary',
-                body=event_data,
-                sendUpdates='all'
-            ).execute()
-            
-            return {
-                "Summary": event.get('summary', 'No Title'),
-                "StartTime": self._parse_event_datetime(event.get('start', {})),
-                "EndTime": self._parse_event_datetime(event.get('end', {})),
-                "Attendees": self._parse_attendees(event.get('attendees', [])),
-                "NumAttendees": len(event.get('attendees', [])) or 1
-            }
+            if not user_email:
+                raise ValueError("No organizer specified for the event")
+            service = self._ensure_service(user_email)
         except Exception as e:
-            print(f"Error creating event: {e}")
-            return {
-                "Summary": event_data.get('summary', 'No Title'),
-                "StartTime": event_data.get('start', {}).get('dateTime', datetime.utcnow().isoformat()),
-                "EndTime": event_data.get('end', {}).get('dateTime', (datetime.utcnow() + timedelta(hours=1)).isoformat()),
-                "Attendees": [attendee.get('email') for attendee in event_data.get('attendees', [])],
-                "NumAttendees": len(event_data.get('attendees', [])) or 1
-            }
+            logger.warning("No service available for user %s, returning mock event: %s", user_email, e)
+            return self._mock_created_event(event_data)
+        
+        try:
+            event = self._insert_event_request(service, event_data).execute()
+        except Exception as e:
+            logger.error("Error creating event: %s", e)
+            return self._mock_created_event(event_data)
+        
+        return self._created_event_result(user_email, event_data, event)
+    
+    def create_events_bulk(self, items: List[Tuple[Optional[str], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Create several calendar events with batched HTTP requests.
+        
+        Inserts are grouped by organizer and each group is sent as one batch,
+        so creating N events costs one round trip per organizer instead of N.
+        
+        Args:
+            items: (organizer email, event data) pairs, as taken by create_event
+            
+        Returns:
+            Created event data for each item, in the same order as ``items``
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        
+        # Group the inserts by organizer; events without a usable organizer
+        # get mock results, as in create_event
+        groups: Dict[str, List[int]] = {}
+        services = {}
+        for index, (user_email, event_data) in enumerate(items):
+            user_email = self._resolve_organizer(user_email, event_data)
+            try:
+                if not user_email:
+                    raise ValueError("No organizer specified for the event")
+                if user_email not in services:
+                    services[user_email] = self._ensure_service(user_email)
+            except Exception as e:
+                logger.warning("No service available for user %s, returning mock event: %s", user_email, e)
+                results[index] = self._mock_created_event(event_data)
+                continue
+            groups.setdefault(user_email, []).append(index)
+        
+        organizers = {
+            index: user_email
+            for user_email, indices in groups.items()
+            for index in indices
+        }
+        
+        def handle_response(request_id, response, exception):
+            index = int(request_id)
+            user_email, event_data = organizers[index], items[index][1]
+            if exception is not None:
+                logger.error("Error creating event: %s", exception)
+                results[index] = self._mock_created_event(event_data)
+            else:
+                results[index] = self._created_event_result(user_email, event_data, response)
+        
+        for user_email, indices in groups.items():
+            service = services[user_email]
+            for i in range(0, len(indices), self.BATCH_LIMIT):
+                chunk = indices[i:i + self.BATCH_LIMIT]
+                batch = service.new_batch_http_request(callback=handle_response)
+                for index in chunk:
+                    batch.add(
+                        self._insert_event_request(service, items[index][1]),
+                        request_id=str(index)
+                    )
+                
+                try:
+                    batch.execute()
+                except Exception as e:
+                    logger.warning("Error executing batch request: %s", e)
+                    for index in chunk:
+                        if results[index] is None:
+                            results[index] = self.create_event(user_email, items[index][1])
+        
+        return results
+    
+    def _resolve_organizer(self, user_email: Optional[str], event_data: Dict[str, Any]) -> Optional[str]:
+        """Get the organizer for an event, falling back to the first attendee."""
+        if user_email:
+            return user_email
+        attendees = event_data.get('attendees') or [{}]
+        return attendees[0].get('email')
+    
+    def _insert_event_request(self, service, event_data: Dict[str, Any]):
+        """Build an ``events().insert`` request on the organizer's primary calendar."""
+        return service.events().insert(
+            calendarId='primary',
+            body=event_data,
+            sendUpdates='all'
+        )
+    
+    def _created_event_result(self, user_email: str, event_data: Dict[str, Any],
+                              event: Dict[str, Any]) -> Dict[str, Any]:
+        """Invalidate affected caches and format an event the API has created."""
+        # Everyone invited now has a changed calendar
+        self.invalidate_events_cache(user_email)
+        for attendee in event_data.get('attendees', []):
+            self.invalidate_events_cache(attendee.get('email'))
+        
+        return {
+            "Summary": event.get('summary', 'No Title'),
+            "StartTime": self._parse_event_datetime(event.get('start', {})),
+            "EndTime": self._parse_event_datetime(event.get('end', {})),
+            "Attendees": self._parse_attendees(event.get('attendees', [])),
+            "NumAttendees": len(event.get('attendees', [])) or 1
+        }
+    
+    def _mock_created_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the result returned when an event could not be created."""
+        return {
+            "Summary": event_data.get('summary', 'No Title'),
+            "StartTime": event_data.get('start', {}).get('dateTime', datetime.utcnow().isoformat()),
+            "EndTime": event_data.get('end', {}).get('dateTime', (datetime.utcnow() + timedelta(hours=1)).isoformat()),
+            "Attendees": [attendee.get('email') for attendee in event_data.get('attendees', [])],
+            "NumAttendees": len(event_data.get('attendees', [])) or 1
+        }
     
     def find_available_slots(self, attendees: List[str], 
                            duration_minutes: int = 30,
@@ -491,66 +836,192 @@ class GoogleCalendarManager:
         time_min = time_min or datetime.utcnow()
         time_max = time_max or time_min + timedelta(days=7)
         
-        # Get all events for each attendee
-        all_events = {}
-        for attendee in attendees:
+        busy = self._get_busy_intervals(attendees, time_min, time_max)
+        return self._compute_available_slots(busy, duration_minutes, time_min, time_max)
+    
+    def iter_available_slots(self, attendees: List[str],
+                             duration_minutes: int = 30,
+                             time_min: Optional[datetime] = None,
+                             time_max: Optional[datetime] = None) -> Iterator[Dict[str, str]]:
+        """Lazily yield the time slots that are free for all attendees.
+        
+        Slots are produced in chronological order, so callers that only need
+        the first few can stop early without searching the rest of the range.
+        Unlike find_available_slots, no default slots are made up when nothing
+        is free.
+        
+        Args:
+            attendees: List of attendee emails
+            duration_minutes: Duration of the meeting in minutes
+            time_min: Start of time range
+            time_max: End of time range
+            
+        Yields:
+            Available time slots
+        """
+        time_min = time_min or datetime.utcnow()
+        time_max = time_max or time_min + timedelta(days=7)
+        
+        busy = self._get_busy_intervals(attendees, time_min, time_max)
+        yield from self._iter_free_slots(busy, duration_minutes, time_min, time_max)
+    
+    def _query_freebusy(self, user_emails: List[str],
+                        time_min: Optional[datetime],
+                        time_max: Optional[datetime]) -> Dict[str, List[Tuple[int, int]]]:
+        """Get busy intervals from the freebusy API, for the calendars it could read.
+        
+        The Calendar API merges each calendar's busy times server-side, so
+        no event lists are downloaded. The query is made with the first
+        loadable user's credentials. Users missing from the result need
+        another source; nothing in it is mock data.
+        """
+        time_min_str, time_max_str = self._format_time_range(time_min, time_max)
+        busy = {}
+        
+        service = None
+        for user_email in user_emails:
             try:
-                if attendee in self.services:
-                    all_events[attendee] = self.get_events(
-                        attendee, 
-                        time_min=time_min, 
-                        time_max=time_max
-                    )
-                else:
-                    all_events[attendee] = self._get_mock_events(attendee, time_min, time_max)
+                service = self._ensure_service(user_email)
+                break
             except Exception as e:
-                print(f"Error getting events for {attendee}: {e}")
-                all_events[attendee] = self._get_mock_events(attendee, time_min, time_max)
+                logger.debug("Cannot query free/busy as %s: %s", user_email, e)
         
-        # Generate potential time slots (every 30 minutes during business hours)
-        slots = []
-        current_date = time_min.replace(hour=9, minute=0, second=0, microsecond=0)
+        if service is None:
+            return busy
         
-        # If current_date is already past business hours, move to next day
-        if current_date.hour >= 17:
-            current_date = (current_date + timedelta(days=1)).replace(hour=9, minute=0, second=0, microsecond=0)
+        for i in range(0, len(user_emails), self.FREEBUSY_LIMIT):
+            chunk = user_emails[i:i + self.FREEBUSY_LIMIT]
+            try:
+                result = service.freebusy().query(body={
+                    'timeMin': time_min_str,
+                    'timeMax': time_max_str,
+                    'items': [{'id': user_email} for user_email in chunk]
+                }).execute()
+            except Exception as e:
+                logger.warning("Error querying free/busy: %s", e)
+                continue
+            
+            calendars = result.get('calendars', {})
+            for user_email in chunk:
+                calendar = calendars.get(user_email)
+                if calendar is None or calendar.get('errors'):
+                    continue
+                busy[user_email] = [
+                    (_to_timestamp(_parse_iso(period['start'])), _to_timestamp(_parse_iso(period['end'])))
+                    for period in calendar.get('busy', ())
+                ]
         
-        while current_date < time_max:
-            # Only consider business hours (9 AM - 5 PM) on weekdays
-            if current_date.weekday() < 5 and 9 <= current_date.hour < 17:
-                end_time = current_date + timedelta(minutes=duration_minutes)
-                
-                # Check if this slot conflicts with any attendee's events
-                is_available = True
-                for attendee_events in all_events.values():
-                    for event in attendee_events:
-                        event_start = datetime.fromisoformat(event["StartTime"].replace('Z', '+00:00'))
-                        event_end = datetime.fromisoformat(event["EndTime"].replace('Z', '+00:00'))
-                        
-                        # Check for overlap
-                        if (current_date < event_end and end_time > event_start):
-                            is_available = False
-                            break
-                    
-                    if not is_available:
-                        break
-                
-                if is_available:
-                    slots.append({
-                        "start_time": current_date.isoformat(),
-                        "end_time": end_time.isoformat()
-                    })
+        return busy
+    
+    def _busy_from_events(self, user_emails: List[str],
+                          time_min: Optional[datetime],
+                          time_max: Optional[datetime]) -> Dict[str, List[Tuple[int, int]]]:
+        """Get busy intervals from the users' event lists, which may be mock data."""
+        fetched = self.get_events_batch(user_emails, time_min=time_min, time_max=time_max)
+        return {
+            user_email: [
+                (_to_timestamp(_parse_iso(event["StartTime"])), _to_timestamp(_parse_iso(event["EndTime"])))
+                for event in fetched.get(user_email, ())
+            ]
+            for user_email in user_emails
+        }
+    
+    def _get_busy_intervals(self, attendees: List[str],
+                            time_min: datetime,
+                            time_max: datetime) -> Tuple[array, array]:
+        """Get everyone's merged busy intervals around a time range.
+        
+        Busy intervals are cached per user and UTC day for BUSY_CACHE_TTL
+        seconds. The days missing from the cache, for any attendee, are
+        fetched for all of those attendees with one freebusy query; only
+        the intervals that query returns are cached.
+        
+        Args:
+            attendees: List of attendee emails
+            time_min: Start of time range
+            time_max: End of time range
             
-            # Move to next 30-minute slot
-            current_date += timedelta(minutes=30)
+        Returns:
+            Tuple of (starts, ends) arrays of epoch seconds, sorted by start,
+            covering every day a slot in the range can touch
+        """
+        # Slots run from 9 AM on time_min's date to 5 PM after time_max
+        first_day = _to_timestamp(time_min.replace(hour=9, minute=0, second=0, microsecond=0)) // 86400
+        last_day = (_to_timestamp(time_max) + 8 * 3600) // 86400
+        days = range(first_day, last_day + 1)
+        
+        cached = {}
+        missing_users = []
+        missing_days = set()
+        for attendee in dict.fromkeys(attendees):
+            cached[attendee] = user_days = {}
+            for day in days:
+                intervals = self._get_cached_busy(attendee, day)
+                if intervals is None:
+                    missing_days.add(day)
+                else:
+                    user_days[day] = intervals
+            if len(user_days) < len(days):
+                missing_users.append(attendee)
+        
+        if missing_users:
+            fetch_first, fetch_last = min(missing_days), max(missing_days)
+            fetch_min = datetime.fromtimestamp(fetch_first * 86400, timezone.utc)
+            fetch_max = datetime.fromtimestamp((fetch_last + 1) * 86400, timezone.utc)
+            
+            # Only freebusy answers are cached here: the event-list fallback
+            # may be mock data, which get_events never caches either
+            fetched = self._query_freebusy(missing_users, fetch_min, fetch_max)
+            from_freebusy = set(fetched)
+            remaining = [attendee for attendee in missing_users if attendee not in fetched]
+            if remaining:
+                fetched.update(self._busy_from_events(remaining, fetch_min, fetch_max))
+            
+            for attendee in missing_users:
+                buckets = {day: [] for day in range(fetch_first, fetch_last + 1)}
+                for start, end in fetched.get(attendee, ()):
+                    for day in range(max(start // 86400, fetch_first),
+                                     min(max(start, end - 1) // 86400, fetch_last) + 1):
+                        buckets[day].append((start, end))
+                
+                for day, intervals in buckets.items():
+                    intervals = tuple(intervals)
+                    if attendee in from_freebusy:
+                        self._cache_busy(attendee, day, intervals)
+                    cached[attendee].setdefault(day, intervals)
+        
+        # Events spanning several days sit in each day's bucket, and shared
+        # meetings in each attendee's; sort and merge each interval only once
+        return _merge_intervals({
+            interval
+            for user_days in cached.values()
+            for intervals in user_days.values()
+            for interval in intervals
+        })
+    
+    def _compute_available_slots(self, busy: Tuple[array, array],
+                                 duration_minutes: int,
+                                 time_min: datetime,
+                                 time_max: datetime) -> List[Dict[str, str]]:
+        """Find up to 10 slots in a time range that are free for every attendee.
+        
+        Args:
+            busy: Merged busy intervals, as returned by _get_busy_intervals
+            duration_minutes: Duration of the meeting in minutes
+            time_min: Start of time range
+            time_max: End of time range
             
-            # If we've reached the end of the business day, move to the next day
-            if current_date.hour >= 17:
-                current_date = (current_date + timedelta(days=1)).replace(hour=9, minute=0, second=0, microsecond=0)
+        Returns:
+            List of available time slots
+        """
+        # Return top 10 available slots; the search stops once they are found
+        slots = list(islice(
+            self._iter_free_slots(busy, duration_minutes, time_min, time_max), 10
+        ))
         
         # If no slots are available, create some default slots
         if not slots:
-            print("No available slots found, creating default slots")
+            logger.debug("No available slots found, creating default slots")
             default_start = time_min.replace(hour=10, minute=0, second=0, microsecond=0)
             if default_start < datetime.utcnow():
                 default_start = datetime.utcnow() + timedelta(days=1)
@@ -565,4 +1036,85 @@ class GoogleCalendarManager:
                         "end_time": (slot_date + timedelta(minutes=duration_minutes)).isoformat()
                     })
         
-        return slots[:10]  # Return top 10 available slots
+        return slots
+    
+    def _iter_free_slots(self, busy: Tuple[array, array],
+                         duration_minutes: int,
+                         time_min: datetime,
+                         time_max: datetime) -> Iterator[Dict[str, str]]:
+        """Yield, in order, the business-hour slots free for every attendee.
+        
+        Args:
+            busy: Merged busy intervals, as returned by _get_busy_intervals
+            duration_minutes: Duration of the meeting in minutes
+            time_min: Start of time range
+            time_max: End of time range
+            
+        Yields:
+            Available time slots
+        """
+        busy_starts, busy_ends = busy
+        duration_seconds = duration_minutes * 60
+        slot_step = 30 * 60
+        
+        # Slots must start before time_max
+        time_max_ts = _to_timestamp(time_max) + (1 if time_max.microsecond else 0)
+        
+        # Business hours (9 AM - 5 PM) in time_min's timezone, on weekdays,
+        # starting from time_min's date: precompute each day's 9 AM as epoch
+        # seconds so the search below never builds datetimes for rejected slots
+        first_day = time_min.replace(hour=9, minute=0, second=0, microsecond=0)
+        first_day_ts = _to_timestamp(first_day)
+        first_weekday = first_day.weekday()
+        num_days = max(0, -(-(time_max_ts - first_day_ts) // 86400))
+        business_days = [
+            i for i in range(num_days)
+            if (first_weekday + i) % 7 < 5
+        ]
+        
+        # Generate potential time slots (every 30 minutes during business hours);
+        # a slot must end by 5 PM and start before time_max
+        latest_offset = (8 * 3600 - duration_seconds) // slot_step * slot_step
+        for i in business_days:
+            day_start_ts = first_day_ts + 86400 * i
+            last_start_ts = min(
+                day_start_ts + latest_offset,
+                day_start_ts + (time_max_ts - 1 - day_start_ts) // slot_step * slot_step
+            )
+            
+            # Format the date and UTC offset once per day ("YYYY-MM-DDT" and
+            # e.g. "+05:30"); slot times are then filled in as HH:MM
+            day_iso = (first_day + timedelta(days=i)).isoformat()
+            date_prefix, offset_suffix = day_iso[:11], day_iso[19:]
+            
+            for slot_start_ts in _free_slot_starts(busy_starts, busy_ends, day_start_ts,
+                                                   last_start_ts, slot_step, duration_seconds):
+                start_minute = 9 * 60 + (slot_start_ts - day_start_ts) // 60
+                end_minute = start_minute + duration_minutes
+                yield {
+                    "start_time": f"{date_prefix}{start_minute // 60:02d}:{start_minute % 60:02d}:00{offset_suffix}",
+                    "end_time": f"{date_prefix}{end_minute // 60:02d}:{end_minute % 60:02d}:00{offset_suffix}"
+                }
+    
+    def _merge_busy_intervals(self, all_events: Dict[str, List[Dict[str, Any]]]) -> Tuple[array, array]:
+        """Merge attendee events into sorted, non-overlapping busy intervals.
+        
+        Event times are parsed exactly once here; the slot search then only
+        compares integers. Only used by AsyncGoogleCalendarManager, which
+        fetches event lists itself; this class gets busy intervals through
+        _get_busy_intervals.
+        
+        Args:
+            all_events: Dict mapping attendee emails to their events
+            
+        Returns:
+            Tuple of (starts, ends) arrays of epoch seconds, sorted by start
+        """
+        return _merge_intervals(
+            (
+                _to_timestamp(_parse_iso(event["StartTime"])),
+                _to_timestamp(_parse_iso(event["EndTime"]))
+            )
+            for events in all_events.values()
+            for event in events
+        )
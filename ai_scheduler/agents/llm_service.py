@@ -1,16 +1,210 @@
 """LLM service for the AI Scheduling Assistant."""
 
+import asyncio
+import hashlib
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Set, Tuple
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Patterns for the templated emails most requests follow; anything they
+# cannot make sense of is left to the LLM
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+_DURATION_RE = re.compile(
+    r'\b(?:(?P<number>\d+(?:\.\d+)?)\s*(?P<unit>hours?|hrs?|minutes?|mins?)'
+    r'|(?P<words>half an?|an?|one)\s+hour)\b'
+    r'(?P<half>\s+and\s+a\s+half)?',
+    re.IGNORECASE
+)
+_TIME_CONSTRAINT_RE = re.compile(
+    r'\b(?:(?:this|next)\s+)?(?:mon|tue|tues|wed|wednes|thu|thur|thurs|fri|sat|satur|sun)(?:day)?\b'
+    r'|\b(?:this|next) week\b',
+    re.IGNORECASE
+)
+# Time-of-day preferences the local slot scorer does not account for
+_TIME_PREFERENCE_RE = re.compile(
+    r'\b(?:afternoon|evening|after lunch|end of (?:the )?day|late|later|noon|eod)\b',
+    re.IGNORECASE
+)
+
+try:
+    # C implementation, several times faster than the standard library
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
+try:
+    # httpx only speaks HTTP/2 when the h2 package is installed
+    import h2  # noqa: F401
+    
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Prompt templates, filled in with str.format; kept short because prompt
+# length drives the LLM's prefill time
+_EMAIL_PROMPT = """Extract the meeting request from the email as JSON:
+{{"participants": [email ids], "meeting_duration": minutes as int, "time_constraints": e.g. "next week" or "Thursday"}}
+Append @amd.com to participants given only by name. Output the JSON only.
+
+Email: {email}
+"""
+
+_SUGGESTION_PROMPT = """Pick the best slot for this meeting. Respect the email's time constraints, keep to 9 AM - 5 PM and prefer mornings for important meetings.
+Subject: {subject}
+Email: {email_content}
+Slots: {slots}
+Output JSON only: {{"selected_slot": slot index, "reasoning": short reason}}
+"""
+
+# JSON schemas for guided decoding, so the LLM can only produce parseable answers
+_PARSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "participants": {"type": "array", "items": {"type": "string"}},
+        "meeting_duration": {"type": "integer"},
+        "time_constraints": {"type": "string"}
+    },
+    "required": ["participants", "meeting_duration", "time_constraints"]
+}
+
+_SUGGEST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "selected_slot": {"type": "integer", "minimum": 0},
+        "reasoning": {"type": "string"}
+    },
+    "required": ["selected_slot", "reasoning"]
+}
+
+def _match_duration(email_text: str) -> Optional[int]:
+    """Find the meeting duration stated in an email, in minutes.
+    
+    Understands e.g. "30 mins", "1.5 hours", "an hour" and "half an hour";
+    returns None when no duration is stated that way.
+    """
+    match = _DURATION_RE.search(email_text)
+    if match is None:
+        return None
+    if match.group('words'):
+        minutes = 30 if match.group('words').lower().startswith('half') else 60
+    elif match.group('unit').lower().startswith('h'):
+        minutes = float(match.group('number')) * 60
+    else:
+        minutes = float(match.group('number'))
+    if match.group('half'):
+        minutes += 30
+    return round(minutes)
+
+
+# English weekday names, indexed by datetime.weekday()
+_WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+def _fmt_slot(start: datetime, end: datetime) -> Tuple[str, str, str, str]:
+    """Format a time range as (weekday, date, start time, end time) for a prompt.
+    
+    Builds the strings directly instead of through strftime, which does
+    locale-aware formatting.
+    """
+    return (
+        _WEEKDAY_NAMES[start.weekday()],
+        f"{start.year:04d}-{start.month:02d}-{start.day:02d}",
+        f"{start.hour:02d}:{start.minute:02d}",
+        f"{end.hour:02d}:{end.minute:02d}"
+    )
+
+
+def _slot_score(slot: Dict[str, Any]) -> Tuple:
+    """Rank a slot for the local scorer: earliest day first, mornings before afternoons."""
+    start = datetime.fromisoformat(slot["start_time"])
+    return (start.date(), 0 if start.hour < 12 else 1, start.hour, start.minute)
+
+
+class _JsonObjectTracker:
+    """Track streamed text until the first top-level JSON object is complete.
+    
+    Counts braces outside of JSON strings, so the stream can be cut off as
+    soon as the answer's closing brace arrives. Any text before the object,
+    such as a "Here is the JSON:" preamble, is dropped once it completes.
+    """
+    
+    def __init__(self):
+        self.text = ""
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._start: Optional[int] = None
+    
+    def feed(self, chunk: str) -> bool:
+        """Add a chunk of streamed text.
+        
+        Returns:
+            True once the first JSON object has been closed; the text
+            around it is dropped
+        """
+        for position, char in enumerate(chunk):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = self._depth > 0
+            elif char == "{":
+                if self._start is None:
+                    self._start = len(self.text) + position
+                self._depth += 1
+            elif char == "}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.text = (self.text + chunk[:position + 1])[self._start:]
+                    return True
+        self.text += chunk
+        return False
+
+
+def _stream_delta(line: str) -> Optional[str]:
+    """Extract the content delta from one server-sent event line of a chat stream."""
+    if not line.startswith("data:"):
+        return None
+    data = line[5:].strip()
+    if not data or data == "[DONE]":
+        return None
+    choices = _json_loads(data).get("choices") or ({},)
+    return choices[0].get("delta", {}).get("content")
+
+
 class LLMService:
     """Service for interacting with the LLM."""
     
+    # How long the async batcher waits for more prompts before sending a batch
+    BATCH_WINDOW = 0.01
+    # Maximum number of prompts sent to the LLM in one batched request
+    MAX_BATCH_SIZE = 32
+    # Sampling temperature; responses are only cached when it is 0
+    TEMPERATURE = 0.0
+    # Number of LLM responses kept in the in-memory response cache
+    RESPONSE_CACHE_SIZE = 1024
+    
     def __init__(self, base_url: str = "http://localhost:3000/v1", model_path: str = "/home/user/Models/deepseek-ai/deepseek-llm-7b-chat", api_key: str = "abc-123"):
         """Initialize the LLM service.
         
@@ -23,36 +217,147 @@ class LLMService:
         self.model_path = model_path
         self.api_key = api_key
         
+        # Reuse connections to the vLLM server across calls
+        self._session = requests.Session()
+        self._session.headers.update({"Authorization": f"Bearer {api_key}"})
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        
+        # httpx clients are bound to the event loop they were first used on
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Async prompts are queued and sent in micro-batches by a background task
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batcher_task: Optional[asyncio.Task] = None
+        self._inflight_batches: Set[asyncio.Task] = set()
+        
+        # Identical prompts get identical answers at temperature 0
+        self._response_cache: "OrderedDict[Tuple[str, bytes], str]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        
     def parse_email(self, email_text: str) -> Dict[str, Any]:
         """Parse email content to extract scheduling information.
         
+        Emails that name their participants by address and state a duration
+        are parsed locally; only the rest are sent to the LLM.
+        
+        Args:
+            email_text: Email content to parse
+            
+        Returns:
+            Dict with extracted information
+        """
+        result = self._parse_email_locally(email_text)
+        if result is not None:
+            return result
+        return self._parse_email_response(self._call_llm(self._email_prompt(email_text), _PARSE_SCHEMA))
+    
+    async def aparse_email(self, email_text: str) -> Dict[str, Any]:
+        """Parse email content without blocking the event loop.
+        
         Args:
             email_text: Email content to parse
             
         Returns:
             Dict with extracted information
         """
-        prompt = f"""
-        You are an Agent that helps in scheduling meetings.
-        Your job is to extract Email IDs and Meeting Duration.
-        You should return:
-        1. List of email ids of participants (comma-separated).
-        2. Meeting duration in minutes.
-        3. Time constraints (e.g., 'next week', 'Thursday').
-        If the List of email ids of participants are just names, then append @amd.com at the end and return.
-        Return as json with 'participants', 'time_constraints' & 'meeting_duration'.
-        Strictly follow the instructions. Strictly return dict with participants email ids, time constraints & meeting duration in minutes only.
-        Do not add any other instructions or information.
+        result = self._parse_email_locally(email_text)
+        if result is not None:
+            return result
+        return self._parse_email_response(await self._aqueue_prompt(self._email_prompt(email_text), _PARSE_SCHEMA))
+    
+    def parse_emails(self, email_texts: List[str]) -> List[Dict[str, Any]]:
+        """Parse several emails, sending the ones that need the LLM in one batch.
         
-        Email: {email_text}
+        Args:
+            email_texts: Email contents to parse
+            
+        Returns:
+            Dict with extracted information for each email, in the same order
         """
+        results = [self._parse_email_locally(email_text) for email_text in email_texts]
+        pending = [i for i, result in enumerate(results) if result is None]
+        
+        prompts = [self._email_prompt(email_texts[i]) for i in pending]
+        for i, response in zip(pending, self._call_llm_batch(prompts, _PARSE_SCHEMA)):
+            results[i] = self._parse_email_response(response)
+        return results
+    
+    async def aparse_emails(self, email_texts: List[str]) -> List[Dict[str, Any]]:
+        """Parse several emails asynchronously, batching the ones that need the LLM.
+        
+        Prompts go through the shared async batcher, so they may also share a
+        request with prompts from other concurrent callers.
         
+        Args:
+            email_texts: Email contents to parse
+            
+        Returns:
+            Dict with extracted information for each email, in the same order
+        """
+        results = [self._parse_email_locally(email_text) for email_text in email_texts]
+        pending = [i for i, result in enumerate(results) if result is None]
+        
+        responses = await asyncio.gather(*[
+            self._aqueue_prompt(self._email_prompt(email_texts[i]), _PARSE_SCHEMA)
+            for i in pending
+        ])
+        for i, response in zip(pending, responses):
+            results[i] = self._parse_email_response(response)
+        return results
+    
+    def parse_email_fast(self, email_text: str) -> Dict[str, Any]:
+        """Extract scheduling information from an email with regular expressions.
+        
+        Args:
+            email_text: Email content to parse
+            
+        Returns:
+            Dict in the same format as parse_email; ``participants`` is empty
+            when the email names no one by address, and ``meeting_duration``
+            is 30 when no duration is stated
+        """
+        duration = _match_duration(email_text)
+        return self._fast_result(email_text, 30 if duration is None else duration)
+    
+    def _parse_email_locally(self, email_text: str) -> Optional[Dict[str, Any]]:
+        """Parse an email with regular expressions when they are enough.
+        
+        Returns:
+            Dict in the same format as parse_email, or None unless the email
+            names its participants by address and states its duration in a
+            form _match_duration understands; those are left to the LLM
+        """
+        duration = _match_duration(email_text)
+        if duration is None:
+            return None
+        result = self._fast_result(email_text, duration)
+        return result if result["participants"] else None
+    
+    def _fast_result(self, email_text: str, meeting_duration: int) -> Dict[str, Any]:
+        """Build a parse_email result from the email's regex matches."""
+        time_constraint = _TIME_CONSTRAINT_RE.search(email_text)
+        
+        return {
+            # A sentence-ending period is not part of the address
+            "participants": [email.rstrip('.') for email in _EMAIL_RE.findall(email_text)],
+            "time_constraints": time_constraint.group(0) if time_constraint else "",
+            "meeting_duration": meeting_duration
+        }
+    
+    def _email_prompt(self, email_text: str) -> str:
+        """Build the prompt that extracts scheduling information from an email."""
+        return _EMAIL_PROMPT.format(email=email_text)
+    
+    def _parse_email_response(self, response: str) -> Dict[str, Any]:
+        """Parse the LLM's reply to the email prompt."""
         try:
-            response = self._call_llm(prompt)
             # Parse the response as JSON
-            return json.loads(response)
+            return _json_loads(response)
         except Exception as e:
-            logger.error(f"Error parsing email with LLM: {e}")
+            logger.error("Error parsing email with LLM: %s", e)
             # Return a default response if parsing fails
             return {
                 "participants": [],
@@ -63,17 +368,79 @@ class LLMService:
     def suggest_meeting_time(self, 
                            request_data: Dict[str, Any], 
                            available_slots: List[Dict[str, Any]],
-                           attendee_events: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+                           attendee_events: Dict[str, List[Dict[str, Any]]],
+                           explain: bool = False) -> Dict[str, Any]:
         """Suggest the best meeting time based on available slots and attendee events.
         
+        The earliest morning slot is picked locally unless the email states a
+        time-of-day preference or an LLM explanation is asked for.
+        
+        Args:
+            request_data: Original request data
+            available_slots: List of available time slots
+            attendee_events: Dictionary of attendee events
+            explain: Always ask the LLM, which also explains its choice
+            
+        Returns:
+            Dict with suggested meeting time
+        """
+        if not explain:
+            suggestion = self._suggest_locally(request_data, available_slots)
+            if suggestion is not None:
+                return suggestion
+        
+        prompt = self._suggestion_prompt(request_data, available_slots)
+        return self._parse_suggestion_response(self._call_llm(prompt, _SUGGEST_SCHEMA), available_slots)
+    
+    async def asuggest_meeting_time(self,
+                                    request_data: Dict[str, Any],
+                                    available_slots: List[Dict[str, Any]],
+                                    attendee_events: Dict[str, List[Dict[str, Any]]],
+                                    explain: bool = False) -> Dict[str, Any]:
+        """Suggest the best meeting time without blocking the event loop.
+        
         Args:
             request_data: Original request data
             available_slots: List of available time slots
             attendee_events: Dictionary of attendee events
+            explain: Always ask the LLM, which also explains its choice
             
         Returns:
             Dict with suggested meeting time
         """
+        if not explain:
+            suggestion = self._suggest_locally(request_data, available_slots)
+            if suggestion is not None:
+                return suggestion
+        
+        prompt = self._suggestion_prompt(request_data, available_slots)
+        return self._parse_suggestion_response(await self.acomplete(prompt, _SUGGEST_SCHEMA), available_slots)
+    
+    def _suggest_locally(self, request_data: Dict[str, Any],
+                         available_slots: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Pick a slot without the LLM, the way the suggestion prompt asks it to.
+        
+        Returns:
+            Dict with the suggested meeting time, or None if the email states a
+            preference only the LLM can weigh
+        """
+        if _TIME_PREFERENCE_RE.search(request_data.get("EmailContent", "") or ""):
+            return None
+        if not available_slots:
+            return {
+                "selected_slot": None,
+                "reasoning": "No available slots."
+            }
+        
+        return {
+            "selected_slot": min(available_slots[:5], key=_slot_score),
+            "reasoning": "Earliest morning slot within business hours."
+        }
+    
+    def _suggestion_prompt(self,
+                           request_data: Dict[str, Any],
+                           available_slots: List[Dict[str, Any]]) -> str:
+        """Build the prompt that asks the LLM to pick one of the available slots."""
         # Limit the number of slots to reduce token usage
         limited_slots = available_slots[:5]  # Only use the first 5 slots
         
@@ -82,61 +449,27 @@ class LLMService:
         for i, slot in enumerate(limited_slots):
             start = datetime.fromisoformat(slot["start_time"])
             end = datetime.fromisoformat(slot["end_time"])
+            day, date, start_time, end_time = _fmt_slot(start, end)
             formatted_slots.append({
                 "index": i,
-                "day": start.strftime("%A"),
-                "date": start.strftime("%Y-%m-%d"),
-                "start_time": start.strftime("%H:%M"),
-                "end_time": end.strftime("%H:%M")
+                "day": day,
+                "date": date,
+                "start_time": start_time,
+                "end_time": end_time
             })
         
-        # Format attendee events - limit to only relevant events
-        formatted_events = {}
-        for attendee, events in attendee_events.items():
-            formatted_events[attendee] = []
-            # Only include events on the same days as the available slots
-            slot_dates = {datetime.fromisoformat(slot["start_time"]).strftime("%Y-%m-%d") for slot in limited_slots}
-            
-            for event in events:
-                event_date = datetime.fromisoformat(event["StartTime"]).strftime("%Y-%m-%d")
-                if event_date in slot_dates:
-                    start = datetime.fromisoformat(event["StartTime"])
-                    end = datetime.fromisoformat(event["EndTime"])
-                    formatted_events[attendee].append({
-                        "day": start.strftime("%A"),
-                        "date": start.strftime("%Y-%m-%d"),
-                        "start_time": start.strftime("%H:%M"),
-                        "end_time": end.strftime("%H:%M"),
-                        "summary": event["Summary"]
-                    })
-        
-        prompt = f"""
-        You are an AI Scheduling Assistant that helps find the optimal meeting time.
-        
-        Meeting Request:
-        Subject: {request_data.get('Subject', 'Meeting')}
-        Email Content: {request_data.get('EmailContent', '')}
-        
-        Available Slots:
-        {json.dumps(formatted_slots, indent=2)}
-        
-        Based on the meeting request and available slots, suggest the best meeting time.
-        Consider:
-        1. Time constraints mentioned in the email
-        2. Working hours (9 AM - 5 PM)
-        3. Preferring morning slots for important meetings
-        
-        Return a JSON with:
-        1. selected_slot: The index of the selected slot from the available slots list
-        2. reasoning: A brief explanation of why this slot was chosen
-        
-        Return only valid JSON.
-        """
-        
+        return _SUGGESTION_PROMPT.format(
+            subject=request_data.get('Subject', 'Meeting'),
+            email_content=request_data.get('EmailContent', ''),
+            slots=_json_dumps(formatted_slots)
+        )
+    
+    def _parse_suggestion_response(self, response: str,
+                                   available_slots: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Parse the LLM's reply to the suggestion prompt into the selected slot."""
         try:
-            response = self._call_llm(prompt)
             # Parse the response as JSON
-            result = json.loads(response)
+            result = _json_loads(response)
             selected_index = result.get("selected_slot", 0)
             
             # Ensure the index is valid
@@ -148,45 +481,381 @@ class LLMService:
                 "reasoning": result.get("reasoning", "This time works for all attendees.")
             }
         except Exception as e:
-            logger.error(f"Error suggesting meeting time with LLM: {e}")
+            logger.error("Error suggesting meeting time with LLM: %s", e)
             # Return the first available slot if parsing fails
             return {
                 "selected_slot": available_slots[0] if available_slots else None,
                 "reasoning": "Default selection due to processing error."
             }
     
-    def _call_llm(self, prompt: str) -> str:
+    async def acomplete(self, prompt: str, schema: Optional[Dict[str, Any]] = None) -> str:
+        """Get the LLM's answer to a prompt over the persistent async connection.
+        
+        Every async call to the LLM, including asuggest_meeting_time and the
+        batched email parsing, goes through the one pooled client returned
+        by _get_async_client.
+        
+        Args:
+            prompt: Prompt to send to the LLM
+            schema: JSON schema to constrain the response to, if any
+            
+        Returns:
+            LLM response text
+        """
+        return await self._acall_llm(prompt, schema)
+    
+    def _call_llm(self, prompt: str, schema: Optional[Dict[str, Any]] = None) -> str:
         """Call the LLM with a prompt.
         
         Args:
             prompt: Prompt to send to the LLM
+            schema: JSON schema to constrain the response to, if any
             
         Returns:
             LLM response text
         """
+        cache_key = self._response_cache_key("chat", prompt, schema)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            payload = {
-                "model": self.model_path,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.0,
-                "max_tokens": 500  # Reduced from 1000 to 500
-            }
+            # Stream the answer and hang up once its JSON object is closed
+            with self._session.post(
+                f"{self.base_url}/chat/completions",
+                json=self._chat_payload(prompt, schema),
+                timeout=10,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    logger.error("Error calling LLM API: %s - %s", response.status_code, response.text)
+                    return "{}"
+                
+                tracker = _JsonObjectTracker()
+                complete = False
+                for line in response.iter_lines(decode_unicode=True):
+                    delta = _stream_delta(line) if line else None
+                    if delta and tracker.feed(delta):
+                        complete = True
+                        break
             
-            headers = {"Authorization": f"Bearer {self.api_key}"}
+            # A stream that ended early is returned once, but never cached
+            if not complete:
+                logger.warning("LLM response ended before its JSON object was complete")
+                return tracker.text
+            self._cache_response(cache_key, tracker.text)
+            return tracker.text
+        except Exception as e:
+            logger.error("Exception when calling LLM API: %s", e)
+            return "{}"
+    
+    async def _acall_llm(self, prompt: str, schema: Optional[Dict[str, Any]] = None) -> str:
+        """Call the LLM with a prompt without blocking the event loop.
+        
+        Args:
+            prompt: Prompt to send to the LLM
+            schema: JSON schema to constrain the response to, if any
+            
+        Returns:
+            LLM response text
+        """
+        cache_key = self._response_cache_key("chat", prompt, schema)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            # Stream the answer and hang up once its JSON object is closed
+            async with self._get_async_client().stream(
+                "POST",
+                "/chat/completions",
+                json=self._chat_payload(prompt, schema)
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    logger.error("Error calling LLM API: %s - %s", response.status_code, response.text)
+                    return "{}"
+                
+                tracker = _JsonObjectTracker()
+                complete = False
+                async for line in response.aiter_lines():
+                    delta = _stream_delta(line)
+                    if delta and tracker.feed(delta):
+                        complete = True
+                        break
+            
+            # A stream that ended early is returned once, but never cached
+            if not complete:
+                logger.warning("LLM response ended before its JSON object was complete")
+                return tracker.text
+            self._cache_response(cache_key, tracker.text)
+            return tracker.text
+        except Exception as e:
+            logger.error("Exception when calling LLM API: %s", e)
+            return "{}"
+    
+    def _call_llm_batch(self, prompts: List[str],
+                        schema: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Call the LLM with several prompts in one completions request.
+        
+        vLLM accepts a list of prompts and schedules them together, so the
+        whole batch costs one HTTP round trip.
+        
+        Args:
+            prompts: Prompts to send to the LLM
+            schema: JSON schema to constrain the response to, if any
             
-            response = requests.post(
-                f"{self.base_url}/chat/completions", 
-                headers=headers,
-                json=payload,
+        Returns:
+            LLM response text for each prompt, in the same order
+        """
+        responses, missing = self._get_cached_responses(prompts, schema)
+        if not missing:
+            return responses
+        prompts = [prompts[i] for i in missing]
+        
+        try:
+            response = self._session.post(
+                f"{self.base_url}/completions",
+                json=self._completions_payload(prompts, schema),
                 timeout=10
             )
             
             if response.status_code == 200:
-                result = response.json()
-                return result["choices"][0]["message"]["content"]
+                texts = self._completion_texts(response.json(), len(prompts))
+                for i, prompt, text in zip(missing, prompts, texts):
+                    responses[i] = text
+                    self._cache_response(self._response_cache_key("completions", prompt, schema), text)
             else:
-                logger.error(f"Error calling LLM API: {response.status_code} - {response.text}")
-                return "{}"
+                logger.error("Error calling LLM API: %s - %s", response.status_code, response.text)
         except Exception as e:
-            logger.error(f"Exception when calling LLM API: {e}")
-            return "{}" 
\ No newline at end of file
+            logger.error("Exception when calling LLM API: %s", e)
+        return responses
+    
+    async def _acall_llm_batch(self, prompts: List[str],
+                               schema: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Call the LLM with several prompts in one request without blocking the event loop.
+        
+        Args:
+            prompts: Prompts to send to the LLM
+            schema: JSON schema to constrain the response to, if any
+            
+        Returns:
+            LLM response text for each prompt, in the same order
+        """
+        responses, missing = self._get_cached_responses(prompts, schema)
+        if not missing:
+            return responses
+        prompts = [prompts[i] for i in missing]
+        
+        try:
+            response = await self._get_async_client().post(
+                "/completions",
+                json=self._completions_payload(prompts, schema)
+            )
+            
+            if response.status_code == 200:
+                texts = self._completion_texts(response.json(), len(prompts))
+                for i, prompt, text in zip(missing, prompts, texts):
+                    responses[i] = text
+                    self._cache_response(self._response_cache_key("completions", prompt, schema), text)
+            else:
+                logger.error("Error calling LLM API: %s - %s", response.status_code, response.text)
+        except Exception as e:
+            logger.error("Exception when calling LLM API: %s", e)
+        return responses
+    
+    def _response_cache_key(self, endpoint: str, prompt: str,
+                            schema: Optional[Dict[str, Any]] = None) -> Tuple[str, bytes]:
+        """Build the response cache key for a prompt sent to an endpoint."""
+        schema_json = _json_dumps(schema) if schema else ""
+        digest = hashlib.blake2b(
+            f"{self.model_path}\0{schema_json}\0{prompt}".encode(), digest_size=16
+        ).digest()
+        return endpoint, digest
+    
+    def _get_cached_response(self, cache_key: Tuple[str, bytes]) -> Optional[str]:
+        """Get a cached LLM response, marking it as recently used."""
+        if self.TEMPERATURE > 0:
+            return None
+        with self._response_cache_lock:
+            response = self._response_cache.get(cache_key)
+            if response is not None:
+                self._response_cache.move_to_end(cache_key)
+            return response
+    
+    def _get_cached_responses(self, prompts: List[str],
+                              schema: Optional[Dict[str, Any]] = None) -> Tuple[List[str], List[int]]:
+        """Look up batched completion prompts in the response cache.
+        
+        Returns:
+            Tuple of (responses, missing) where responses holds the cached
+            text for each prompt ("{}" if not cached) and missing lists the
+            indices of prompts that still need to be sent
+        """
+        responses = ["{}"] * len(prompts)
+        missing = []
+        for i, prompt in enumerate(prompts):
+            cached = self._get_cached_response(self._response_cache_key("completions", prompt, schema))
+            if cached is None:
+                missing.append(i)
+            else:
+                responses[i] = cached
+        return responses, missing
+    
+    def _cache_response(self, cache_key: Tuple[str, bytes], response: str):
+        """Store a successful LLM response, evicting the least recently used one."""
+        if self.TEMPERATURE > 0:
+            return
+        with self._response_cache_lock:
+            self._response_cache[cache_key] = response
+            self._response_cache.move_to_end(cache_key)
+            if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+    
+    def _completions_payload(self, prompts: List[str],
+                             schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build the batched completion request body for a list of prompts."""
+        payload = {
+            "model": self.model_path,
+            "prompt": prompts,
+            "temperature": self.TEMPERATURE,
+            "max_tokens": 128
+        }
+        if schema:
+            # vLLM constrains decoding to the schema, so the answer always parses
+            payload["guided_json"] = schema
+        return payload
+    
+    def _completion_texts(self, result: Dict[str, Any], num_prompts: int) -> List[str]:
+        """Order a batched completion result's texts by the prompt they answer."""
+        texts = ["{}"] * num_prompts
+        for position, choice in enumerate(result.get("choices", [])):
+            index = choice.get("index", position)
+            if 0 <= index < num_prompts:
+                texts[index] = choice.get("text", "{}")
+        return texts
+    
+    def _chat_payload(self, prompt: str,
+                      schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build the chat completion request body for a prompt."""
+        payload = {
+            "model": self.model_path,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": self.TEMPERATURE,
+            "max_tokens": 128,  # Answers are a small JSON object
+            "stream": True
+        }
+        if schema:
+            # vLLM constrains decoding to the schema, so the answer always parses
+            payload["response_format"] = {"type": "json_object"}
+            payload["guided_json"] = schema
+        return payload
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the persistent async HTTP client for the running event loop.
+        
+        The client keeps connections to the vLLM server alive between calls;
+        a new one is created when called from a different event loop. Code
+        that runs a short-lived loop must await aclose() before the loop ends,
+        or the client's connections are never closed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=10,
+                http2=_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=64, max_connections=128)
+            )
+            self._async_client_loop = loop
+        return self._async_client
+    
+    async def _aqueue_prompt(self, prompt: str, schema: Optional[Dict[str, Any]] = None) -> str:
+        """Send a prompt to the LLM through the async micro-batcher.
+        
+        Args:
+            prompt: Prompt to send to the LLM
+            schema: JSON schema to constrain the response to, if any
+            
+        Returns:
+            LLM response text
+        """
+        cached = self._get_cached_response(self._response_cache_key("completions", prompt, schema))
+        if cached is not None:
+            return cached
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._ensure_started().put((prompt, schema, future))
+        return await future
+    
+    def _ensure_started(self) -> asyncio.Queue:
+        """Get the batcher queue for the running event loop, starting the batcher if needed."""
+        loop = asyncio.get_running_loop()
+        if (self._batcher_task is None or self._batcher_task.done()
+                or self._batcher_task.get_loop() is not loop):
+            self._batch_queue = asyncio.Queue()
+            self._inflight_batches = set()
+            self._batcher_task = loop.create_task(self._batch_loop(self._batch_queue))
+        return self._batch_queue
+    
+    async def _batch_loop(self, queue: asyncio.Queue):
+        """Collect queued prompts into batches and dispatch them to the LLM.
+        
+        Waits for one prompt, then keeps collecting for up to BATCH_WINDOW
+        seconds or MAX_BATCH_SIZE prompts. Prompts are sent in one request per
+        schema, without waiting for the previous batch to finish.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.BATCH_WINDOW
+            while len(batch) < self.MAX_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            groups: Dict[int, List[Tuple[str, Optional[Dict[str, Any]], asyncio.Future]]] = {}
+            for item in batch:
+                groups.setdefault(id(item[1]), []).append(item)
+            
+            for group in groups.values():
+                task = loop.create_task(self._dispatch_batch(group))
+                self._inflight_batches.add(task)
+                task.add_done_callback(self._inflight_batches.discard)
+    
+    async def _dispatch_batch(self, batch: List[Tuple[str, Optional[Dict[str, Any]], asyncio.Future]]):
+        """Send one batch of prompts sharing a schema and resolve each caller's future."""
+        try:
+            responses = await self._acall_llm_batch(
+                [prompt for prompt, _, _ in batch],
+                batch[0][1]
+            )
+        except BaseException as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            raise
+        for (_, _, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
+    
+    async def aclose(self):
+        """Stop the async batcher and close the async HTTP client on the running loop."""
+        if self._batcher_task is not None and self._batcher_task.get_loop() is asyncio.get_running_loop():
+            self._batcher_task.cancel()
+            for task in list(self._inflight_batches):
+                task.cancel()
+            await asyncio.gather(self._batcher_task, *self._inflight_batches, return_exceptions=True)
+        self._batcher_task = None
+        self._batch_queue = None
+        self._inflight_batches = set()
+        
+        if self._async_client is not None and self._async_client_loop is asyncio.get_running_loop():
+            await self._async_client.aclose()
+        self._async_client = None
+        self._async_client_loop = None
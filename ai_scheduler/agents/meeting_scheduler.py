@@ -1,17 +1,108 @@
 """Meeting scheduler for the AI Scheduling Assistant."""
 
+import asyncio
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import math
+from typing import Dict, Any, List, Optional, Iterable, Tuple
 from datetime import datetime, timedelta, timezone
 import json
 import re
+from array import array
+from functools import lru_cache
+from itertools import chain
 
-from agents.llm_service import LLMService
-from agents.calendar_manager import GoogleCalendarManager
+from .llm_service import LLMService
+from .calendar_manager import GoogleCalendarManager
 
 logger = logging.getLogger(__name__)
 
+# India Standard Time, in which business hours are defined
+IST = timezone(timedelta(hours=5, minutes=30))
+UTC = timezone.utc
+
+# Meetings start on the hour or half hour; IST's offset is a whole number of
+# slots, so boundaries are the same in UTC and IST
+_SLOT_SECONDS = 30 * 60
+
+# Day and week keywords understood in time constraints
+_TIME_KEYWORD_RE = re.compile(
+    r'monday|tuesday|wednesday|thurs(?:day)?|friday|saturday|sunday|next\s+week|this\s+week',
+    re.IGNORECASE
+)
+_WEEKDAYS = {
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3, "thurs": 3,
+    "friday": 4, "saturday": 5, "sunday": 6
+}
+
+
+def _every_slot_mask(count: int) -> int:
+    """Bitmask with ``count`` bits set, one every slot length in minutes.
+    
+    Sums the geometric series ``1 + 2**30 + 2**60 + ...`` in closed form.
+    """
+    step = _SLOT_SECONDS // 60
+    return ((1 << (step * count)) - 1) // ((1 << step) - 1)
+
+
+def _first_free_run(busy_mask: int, allowed_mask: int, total_bins: int, length: int) -> int:
+    """Find the first allowed start of ``length`` consecutive free minutes.
+    
+    Works on whole bitmasks at once: ``runs`` keeps bit i only while minutes
+    i to i + covered - 1 are all free, and ``covered`` doubles each step, so
+    only O(log length) big-integer operations are needed.
+    
+    Args:
+        busy_mask: Bit i set when minute i is busy
+        allowed_mask: Bit i set when a slot may start at minute i
+        total_bins: Number of minutes in the window
+        length: Required run length in minutes
+        
+    Returns:
+        Index of the first minute of the run, or -1 if there is none
+    """
+    runs = ~busy_mask & ((1 << total_bins) - 1)
+    covered = 1
+    while covered < length and runs:
+        shift = min(covered, length - covered)
+        runs &= runs >> shift
+        covered += shift
+    
+    hits = runs & allowed_mask
+    return (hits & -hits).bit_length() - 1
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime_cached(dt_str: str) -> Optional[datetime]:
+    """Parse a non-empty datetime string, once per distinct string.
+    
+    The same events are parsed for every attendee who shares them and on
+    every request, so results are memoized; datetimes are immutable.
+    """
+    try:
+        # Try parsing date only
+        if 'T' not in dt_str:
+            return datetime.strptime(dt_str, '%Y-%m-%d').replace(tzinfo=UTC)
+        
+        if dt_str.endswith('Z'):
+            dt_str = dt_str[:-1] + '+00:00'
+        parsed = datetime.fromisoformat(dt_str)
+        
+        # Local datetime without timezone
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=UTC)
+        return parsed
+    except Exception as e:
+        logger.error("Error parsing datetime %s: %s", dt_str, e)
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _time_keywords(time_constraints: str) -> frozenset:
+    """Get the lowercased day and week keywords in a time constraint string."""
+    return frozenset(" ".join(match.lower().split()) for match in _TIME_KEYWORD_RE.findall(time_constraints))
+
+
 class MeetingScheduler:
     """Main orchestrator for scheduling meetings."""
     
@@ -30,6 +121,11 @@ class MeetingScheduler:
                            time_min: datetime, time_max: datetime, duration_minutes: int) -> Optional[Dict]:
         """Find an available time slot that works for all attendees.
         
+        Everyone's busy time is packed into one integer bitmask with a bit per
+        minute of the search window, so checking a slot is a shift and an AND.
+        Slots start on the hour or half hour within business hours (10 AM -
+        5 PM IST), and the first free one is returned.
+        
         Args:
             requester_events: List of events for the meeting requester
             attendee_events: Dict mapping attendee emails to their events
@@ -41,91 +137,117 @@ class MeetingScheduler:
             Dict with 'start_time' and 'end_time' in ISO format if a slot is found, None otherwise
         """
         try:
-            # Convert duration to timedelta
-            duration = timedelta(minutes=duration_minutes)
-            
-            # Start from the beginning of the time window
-            current_time = time_min.replace(second=0, microsecond=0)
-            
-            # Try to find a slot within the next 7 days
-            while current_time + duration <= time_max:
-                slot_end = current_time + duration
-                
-                # Check if this slot works for the requester
-                requester_available = not any(
-                    self._is_time_in_event(current_time, slot_end, event)
-                    for event in requester_events
-                )
-                
-                # Check if this slot works for all attendees
-                all_attendees_available = True
-                for email, events in attendee_events.items():
-                    if any(self._is_time_in_event(current_time, slot_end, event) for event in events):
-                        all_attendees_available = False
-                        break
-                
-                if requester_available and all_attendees_available:
-                    return {
-                        'start_time': current_time.isoformat(),
-                        'end_time': slot_end.isoformat()
-                    }
-                
-                # Move to the next 30-minute slot
-                current_time += timedelta(minutes=30)
+            if time_min.tzinfo is None:
+                time_min = time_min.replace(tzinfo=UTC)
+            if time_max.tzinfo is None:
+                time_max = time_max.replace(tzinfo=UTC)
+            
+            # Everything below works on epoch seconds; a slot must start at or
+            # after time_min and end by time_max
+            time_min_ts = math.ceil(time_min.timestamp())
+            time_max_ts = math.floor(time_max.timestamp())
+            duration = duration_minutes * 60
+            
+            # Bit i of the mask is minute i of the window, counted from origin
+            origin_ts = time_min_ts // 60 * 60
+            total_bins = max(0, -((origin_ts - time_max_ts) // 60))
+            starts, ends = self._events_to_arrays(chain(requester_events, *attendee_events.values()))
+            busy_mask = self._build_busy_mask(starts, ends, origin_ts, total_bins)
+            
+            # Mark the minute at which each allowed slot would start
+            allowed_mask = 0
+            day = time_min.astimezone(IST).replace(hour=0, minute=0, second=0, microsecond=0)
+            while day < time_max:
+                # First slot boundary in the day's business hours
+                first = max(int(day.replace(hour=10).timestamp()), time_min_ts)
+                first = -(-first // _SLOT_SECONDS) * _SLOT_SECONDS
+                day_end = min(int(day.replace(hour=17).timestamp()), time_max_ts)
                 
-                # If we've moved to the next day, skip to business hours
-                if current_time.hour >= 17:  # After 5 PM
-                    # Move to 10 AM next day
-                    current_time = (current_time + timedelta(days=1)).replace(hour=10, minute=0)
+                if first + duration <= day_end:
+                    count = (day_end - duration - first) // _SLOT_SECONDS + 1
+                    allowed_mask |= _every_slot_mask(count) << ((first - origin_ts) // 60)
                 
-            return None
+                day += timedelta(days=1)
             
-        except Exception as e:
-            logger.error(f"Error finding available slot: {e}")
-            return None
+            start_bin = _first_free_run(busy_mask, allowed_mask, total_bins, duration_minutes)
+            if start_bin < 0:
+                return None
             
-    def _is_time_in_event(self, start_time: datetime, end_time: datetime, event: Dict) -> bool:
-        """Check if the given time range overlaps with an event."""
-        try:
-            event_start = self._parse_datetime(event.get('start', {}).get('dateTime') or event.get('start', {}).get('date'))
-            event_end = self._parse_datetime(event.get('end', {}).get('dateTime') or event.get('end', {}).get('date'))
-            
-            if not event_start or not event_end:
-                return False
-                
-            # Check for overlap
-            return (start_time < event_end) and (end_time > event_start)
+            start_ts = origin_ts + start_bin * 60
+            return {
+                'start_time': datetime.fromtimestamp(start_ts, time_min.tzinfo).isoformat(),
+                'end_time': datetime.fromtimestamp(start_ts + duration, time_min.tzinfo).isoformat()
+            }
             
         except Exception as e:
-            logger.error(f"Error checking event overlap: {e}")
-            return False
+            logger.error("Error finding available slot: %s", e)
+            return None
+    
+    def _events_to_arrays(self, events: Iterable[Dict]) -> Tuple[array, array]:
+        """Parse events once into parallel arrays of start and end epoch seconds.
+        
+        Starts are rounded down and ends up to the whole second; events whose
+        times cannot be parsed are ignored.
+        """
+        starts = array('q')
+        ends = array('q')
+        for event in events:
+            event_start, event_end = self._event_bounds(event)
+            if event_start and event_end:
+                starts.append(math.floor(event_start.timestamp()))
+                ends.append(math.ceil(event_end.timestamp()))
+        return starts, ends
+    
+    def _build_busy_mask(self, starts: array, ends: array, origin_ts: int, total_bins: int) -> int:
+        """Build a bitmask with a set bit for each busy minute after origin.
+        
+        A minute is busy if any event overlaps it.
+        
+        Args:
+            starts: Event start times, in epoch seconds
+            ends: Matching event end times
+            origin_ts: Time of bit 0, in epoch seconds on a whole minute
+            total_bins: Number of minutes covered by the mask
             
+        Returns:
+            Busy-minute bitmask
+        """
+        mask = 0
+        for start, end in zip(starts, ends):
+            start_bin = max(0, (start - origin_ts) // 60)
+            end_bin = min(total_bins, -((origin_ts - end) // 60))
+            if end_bin > start_bin:
+                mask |= ((1 << (end_bin - start_bin)) - 1) << start_bin
+        return mask
+    
+    def _event_bounds(self, event: Dict) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Get an event's start and end times.
+        
+        Accepts both the calendar manager's format ('StartTime'/'EndTime')
+        and the Google Calendar API's ('start'/'end' dicts).
+        """
+        if 'StartTime' in event:
+            return self._parse_datetime(event.get('StartTime')), self._parse_datetime(event.get('EndTime'))
+        return (
+            self._parse_datetime(event.get('start', {}).get('dateTime') or event.get('start', {}).get('date')),
+            self._parse_datetime(event.get('end', {}).get('dateTime') or event.get('end', {}).get('date'))
+        )
+    
     def _parse_datetime(self, dt_str: Optional[str]) -> Optional[datetime]:
         """Parse a datetime string from Google Calendar API."""
         if not dt_str:
             return None
-            
-        try:
-            # Try parsing with timezone
-            if 'T' in dt_str and ('+' in dt_str or 'Z' in dt_str):
-                if dt_str.endswith('Z'):
-                    dt_str = dt_str[:-1] + '+00:00'
-                return datetime.fromisoformat(dt_str)
-            # Try parsing date only
-            elif 'T' not in dt_str:
-                return datetime.strptime(dt_str, '%Y-%m-%d').replace(tzinfo=timezone.utc)
-            else:
-                # Local datetime without timezone
-                return datetime.fromisoformat(dt_str).replace(tzinfo=timezone.utc)
-        except Exception as e:
-            logger.error(f"Error parsing datetime {dt_str}: {e}")
-            return None
+        return _parse_datetime_cached(dt_str)
     
-    def schedule_meeting(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+    def schedule_meeting(self, request_data: Dict[str, Any],
+                         parsed_email: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Schedule a meeting based on the request data.
         
         Args:
             request_data: Meeting request data
+            parsed_email: Optional result of ``LLMService.parse_email`` for the
+                request's email; its non-empty values override the keyword
+                extraction below
             
         Returns:
             Scheduled meeting data
@@ -143,6 +265,9 @@ class MeetingScheduler:
             else:
                 email_info["meeting_duration"] = 30  # Default duration
             
+            if parsed_email:
+                email_info.update((key, value) for key, value in parsed_email.items() if value)
+            
             # 2. Get the list of attendees
             attendees = [a["email"] for a in request_data.get("Attendees", [])]
             
@@ -150,55 +275,38 @@ class MeetingScheduler:
             sender_email = request_data.get("From")
             if sender_email and sender_email not in attendees:
                 attendees.append(sender_email)
-            logger.info(attendees)
+            logger.info("Attendees: %s", attendees)
             # 3. Extract time constraints from email content
             time_constraints = request_data.get("TimeConstraints", "")
-            logger.info(time_constraints)
+            if not time_constraints and isinstance(email_info.get("time_constraints"), str):
+                time_constraints = email_info["time_constraints"]
+            logger.info("Time constraints: %s", time_constraints)
             if not time_constraints and "EmailContent" in request_data:
                 # Try to extract from email content
                 time_constraints = request_data["EmailContent"]
                 
                 # Log the extracted time constraints for debugging
-                logger.info(f"Extracted time constraints from email: {time_constraints}")
+                logger.info("Extracted time constraints from email: %s", time_constraints)
             
             # 4. Parse time constraints and get available time slots
             time_min, time_max = self._parse_time_constraints(time_constraints)
-            logger.info(time_min, time_max)
             # Log the parsed time range for debugging
-            logger.info(f"Parsed time range: {time_min.isoformat()} to {time_max.isoformat()}")
+            logger.info("Parsed time range: %s to %s", time_min, time_max)
             
-            # 5. Get attendee events for context
-            requester_events = []
-            attendee_events = {}
-            
-            # Get events for the requester
-            try:
-                requester_events = self.calendar_manager.get_events(
-                    user_email=sender_email,
-                    time_min=time_min,
-                    time_max=time_max
-                )
-            except ExceptError processing scheduling requestion as e:
-                logger.error(f"Error getting events for requester {sender_email}: {e}")
-                requester_events = []
-            
-            # Get events for each attendee
-            for attendee in attendees:
-                if attendee == sender_email:  # Skip requester, already fetched
-                    continue
-                    
-                try:
-                    attendee_events[attendee] = self.calendar_manager.get_events(
-                        user_email=attendee,
-                        time_min=time_min,
-                        time_max=time_max
-                    )
-                except Exception as e:
-                    logger.error(f"Error getting events for {attendee}: {e}")
-                    attendee_events[attendee] = []
+            # 5. Get attendee events for context, fetching all calendars at once
+            fetched_events = self._get_events_for_users(
+                [sender_email] + [attendee for attendee in attendees if attendee != sender_email],
+                time_min,
+                time_max
+            )
+            requester_events = fetched_events.pop(sender_email, [])
+            attendee_events = fetched_events
             
             # 6. Find an available time slot
-            duration_mins = email_info.get("meeting_duration", 30)
+            try:
+                duration_mins = int(email_info.get("meeting_duration", 30))
+            except (TypeError, ValueError):
+                duration_mins = 30
             selected_slot = self._find_available_slot(
                 requester_events=requester_events,
                 attendee_events=attendee_events,
@@ -213,7 +321,9 @@ class MeetingScheduler:
                     None,
                     attendees,
                     duration_mins,
-                    "Could not find an available time slot that works for all attendees."
+                    "Could not find an available time slot that works for all attendees.",
+                    attendee_events=attendee_events,
+                    requester_events=requester_events
                 )
             
             # 7. Create the event for the requester
@@ -222,9 +332,8 @@ class MeetingScheduler:
             end_dt = datetime.fromisoformat(selected_slot["end_time"])
             
             # Convert to IST for display
-            ist = timezone(timedelta(hours=5, minutes=30))
-            start_ist = start_dt.astimezone(ist)
-            end_ist = end_dt.astimezone(ist)
+            start_ist = start_dt.astimezone(IST)
+            end_ist = end_dt.astimezone(IST)
             
             # Format for Google Calendar API
             event_data = {
@@ -249,7 +358,8 @@ class MeetingScheduler:
                 event_data["location"] = request_data["Location"]
             
             # Log the event data for debugging
-            logger.info(f"Creating event: {json.dumps(event_data, indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Creating event: %s", json.dumps(event_data, indent=2))
             
             # Create the event
             try:
@@ -270,23 +380,97 @@ class MeetingScheduler:
                     },
                     attendees,
                     duration_mins,
-                    "Meeting scheduled successfully."
+                    "Meeting scheduled successfully.",
+                    attendee_events=attendee_events,
+                    requester_events=requester_events
                 )
                 
             except Exception as e:
-                logger.error(f"Error creating event: {e}")
+                logger.error("Error creating event: %s", e)
                 return self._create_response(
                     request_data,
                     selected_slot,
                     attendees,
                     duration_mins,
-                    f"Error creating event: {e}"
+                    f"Error creating event: {e}",
+                    attendee_events=attendee_events,
+                    requester_events=requester_events
                 )
             
         except Exception as e:
-            logger.error(f"Error scheduling meeting: {e}")
+            logger.error("Error scheduling meeting: %s", e)
             return request_data
     
+    async def aschedule_meetings(self, requests_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Schedule several meetings concurrently.
+        
+        Every request's email is parsed in one batched LLM request, so N
+        requests cost one LLM round trip instead of N; the calendar work for
+        each request then runs in its own worker thread.
+        
+        Args:
+            requests_data: Meeting request data, one dict per request
+            
+        Returns:
+            Scheduled meeting data for each request, in the same order
+        """
+        parsed_emails = await self.llm_service.aparse_emails([
+            request_data.get("EmailContent", "") for request_data in requests_data
+        ])
+        
+        return list(await asyncio.gather(*[
+            asyncio.to_thread(self.schedule_meeting, request_data, parsed_email)
+            for request_data, parsed_email in zip(requests_data, parsed_emails)
+        ]))
+    
+    def schedule_meetings(self, requests_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Schedule several meetings concurrently from synchronous code.
+        
+        Args:
+            requests_data: Meeting request data, one dict per request
+            
+        Returns:
+            Scheduled meeting data for each request, in the same order
+        """
+        async def run() -> List[Dict[str, Any]]:
+            try:
+                return await self.aschedule_meetings(requests_data)
+            finally:
+                # The LLM service's async client is bound to this run's loop,
+                # so close it before asyncio.run closes the loop
+                await self.llm_service.aclose()
+        
+        return asyncio.run(run())
+    
+    def _get_events_for_users(self, user_emails: List[Optional[str]],
+                              time_min: datetime, time_max: datetime) -> Dict[str, List[Dict]]:
+        """Fetch several users' events with one batched calendar request.
+        
+        Args:
+            user_emails: Emails of the users
+            time_min: Start of time range
+            time_max: End of time range
+            
+        Returns:
+            Dict mapping each user email to its events; users whose events
+            could not be fetched map to an empty list
+        """
+        user_emails = list(dict.fromkeys(user_emails))
+        if not user_emails:
+            return {}
+        
+        try:
+            events = self.calendar_manager.get_events_batch(
+                user_emails,
+                time_min=time_min,
+                time_max=time_max
+            )
+        except Exception as e:
+            logger.error("Error getting events for %s: %s", ', '.join(map(str, user_emails)), e)
+            events = {}
+        
+        return {user_email: events.get(user_email, []) for user_email in user_emails}
+    
     def _parse_time_constraints(self, time_constraints: str) -> tuple[datetime, datetime]:
         """Parse time constraints from email.
         
@@ -296,86 +480,65 @@ class MeetingScheduler:
         Returns:
             Tuple of (time_min, time_max) with timezone-aware datetimes
         """
-        # Define IST timezone (UTC+5:30)
-        ist = timezone(timedelta(hours=5, minutes=30))
-        
-        # Get current time in UTC and convert to IST
-        now_utc = datetime.now(timezone.utc)
-        now_ist = now_utc.astimezone(ist)
+        # Work in IST throughout; the returned datetimes are timezone-aware,
+        # so callers see the same instants as UTC ones
+        now_ist = datetime.now(IST)
         
         # Default: next 7 days
-        time_min = now_utc
-        time_max = now_utc + timedelta(days=7)
+        time_min = now_ist
+        time_max = now_ist + timedelta(days=7)
         
-        # Extract day from the time_constraints
+        # Find every day and week keyword in one pass
+        keywords = frozenset()
         if time_constraints and isinstance(time_constraints, str):
-            # Check if the email mentions a specific day
-            if "thursday" in time_constraints.lower() or "thurs" in time_constraints.lower():
-                # Find the next Thursday
-                days_ahead = (3 - now_ist.weekday()) % 7
-                if days_ahead == 0 and now_ist.hour >= 17:  # If it's already Thursday and past business hours
-                    days_ahead = 7  # Go to next Thursday
-                
-                # Create the datetime for next Thursday
-                next_thursday = now_ist + timedelta(days=days_ahead)
-                time_min_ist = next_thursday.replace(hour=10, minute=0, second=0, microsecond=0, tzinfo=ist)
-                time_max_ist = next_thursday.replace(hour=17, minute=0, second=0, microsecond=0, tzinfo=ist)
-                
-                # Convert back to UTC for consistencyf
-                return time_min_ist.astimezone(timezone.utc), time_max_ist.astimezone(timezone.utc)
-        
-        # Look for specific days
-        days = {
-            "monday": 0, "tuesday": 1, "wednesday": 2, 
-            "thursday": 3, "friday": 4, "saturday": 5, "sunday": 6
-        }
+            keywords = _time_keywords(time_constraints)
+        day_nums = {_WEEKDAYS[keyword] for keyword in keywords if keyword in _WEEKDAYS}
         
-        for day, day_num in days.items():
-            if day in time_constraints.lower():
-                # Find the next occurrence of this day in IST
-                days_ahead = (day_num - now_ist.weekday()) % 7
-                if days_ahead == 0 and now_ist.hour >= 17:  # If it's already past business hours
-                    days_ahead = 7  # Go to next week
-                
-                next_day = now_ist + timedelta(days=days_ahead)
-                time_min_ist = next_day.replace(hour=10, minute=0, second=0, microsecond=0, tzinfo=ist)
-                time_max_ist = next_day.replace(hour=17, minute=0, second=0, microsecond=0, tzinfo=ist)
-                
-                # Convert back to UTC for consistency
-                return time_min_ist.astimezone(timezone.utc), time_max_ist.astimezone(timezone.utc)
+        # Look for specific days; Thursday wins, then the earliest in the week
+        if day_nums:
+            day_num = 3 if 3 in day_nums else min(day_nums)
+            
+            # Find the next occurrence of this day in IST
+            days_ahead = (day_num - now_ist.weekday()) % 7
+            if days_ahead == 0 and now_ist.hour >= 17:  # If it's already past business hours
+                days_ahead = 7  # Go to next week
+            
+            next_day = now_ist + timedelta(days=days_ahead)
+            time_min_ist = next_day.replace(hour=10, minute=0, second=0, microsecond=0)
+            time_max_ist = next_day.replace(hour=17, minute=0, second=0, microsecond=0)
+            
+            return time_min_ist, time_max_ist
         
         # Look for "next week"
-        if "next week" in time_constraints.lower():
+        if "next week" in keywords:
             # Start of next week (Monday) in IST
             days_ahead = (0 - now_ist.weekday()) % 7
             if days_ahead == 0:
                 days_ahead = 7  # Go to next week
             
             next_monday = now_ist + timedelta(days=days_ahead)
-            time_min_ist = next_monday.replace(hour=10, minute=0, second=0, microsecond=0, tzinfo=ist)
-            time_max_ist = (next_monday + timedelta(days=4)).replace(hour=17, minute=0, second=0, microsecond=0, tzinfo=ist)  # Friday
+            time_min_ist = next_monday.replace(hour=10, minute=0, second=0, microsecond=0)
+            time_max_ist = (next_monday + timedelta(days=4)).replace(hour=17, minute=0, second=0, microsecond=0)  # Friday
             
-            # Convert back to UTC
-            return time_min_ist.astimezone(timezone.utc), time_max_ist.astimezone(timezone.utc)
+            return time_min_ist, time_max_ist
         
         # Look for "this week"
-        if "this week" in time_constraints.lower():
+        if "this week" in keywords:
             # Current day or next day if it's already past business hours in IST
             if now_ist.hour >= 17:
-                time_min_ist = (now_ist + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0, tzinfo=ist)
+                time_min_ist = (now_ist + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
             else:
-                time_min_ist = now_ist.replace(hour=now_ist.hour, minute=0, second=0, microsecond=0, tzinfo=ist)
+                time_min_ist = now_ist.replace(hour=now_ist.hour, minute=0, second=0, microsecond=0)
             
             # End of week (Friday) in IST
             days_ahead = (4 - now_ist.weekday()) % 7
             if days_ahead == 0 and now_ist.hour >= 17:  # If it's Friday and past business hours
-                time_min_ist = (now_ist + timedelta(days=3)).replace(hour=10, minute=0, second=0, microsecond=0, tzinfo=ist)  # Next Monday
-                time_max_ist = (now_ist + timedelta(days=7)).replace(hour=17, minute=0, second=0, microsecond=0, tzinfo=ist)  # Next Friday
+                time_min_ist = (now_ist + timedelta(days=3)).replace(hour=10, minute=0, second=0, microsecond=0)  # Next Monday
+                time_max_ist = (now_ist + timedelta(days=7)).replace(hour=17, minute=0, second=0, microsecond=0)  # Next Friday
             else:
-                time_max_ist = now_ist.replace(hour=17, minute=0, second=0, microsecond=0, tzinfo=ist)
+                time_max_ist = now_ist.replace(hour=17, minute=0, second=0, microsecond=0)
             
-            # Convert back to UTC
-            return time_min_ist.astimezone(timezone.utc), time_max_ist.astimezone(timezone.utc)
+            return time_min_ist, time_max_ist
         
         # Default case: return timezone-aware datetimes
         return time_min, time_max
@@ -385,7 +548,9 @@ class MeetingScheduler:
                        selected_slot: Optional[Dict[str, str]],
                        attendees: List[str],
                        duration_mins: int,
-                       message: str) -> Dict[str, Any]:
+                       message: str,
+                       attendee_events: Optional[Dict[str, List[Dict]]] = None,
+                       requester_events: Optional[List[Dict]] = None) -> Dict[str, Any]:
         """Create the response object.
         
         Args:
@@ -394,6 +559,8 @@ class MeetingScheduler:
             attendees: List of attendees
             duration_mins: Meeting duration in minutes
             message: Status message
+            attendee_events: Events already fetched for the attendees
+            requester_events: Events already fetched for the requester
             
         Returns:
             Response data
@@ -414,60 +581,31 @@ class MeetingScheduler:
             "Summary": event_summary
         }
         
-        # Get events for each attendee and add the scheduled event
-        attendee_data = []
-        for attendee in attendees:
-            try:
-                # Get existing events for this attendee
-                events = []
-                if attendee in self.calendar_manager.services:
-                    events = self.calendar_manager.get_events(
-                        attendee,
-                        time_min=datetime.now(),
-                        time_max=datetime.now() + timedelta(days=7)
-                    )
-                
-                # Add the newly scheduled event to the list if we have a valid slot
-                if selected_slot:
-                    events.append(scheduled_event)
-                    
-                attendee_data.append({
-                    "email": attendee,
-                    "events": events
-                })
-            except Exception as e:
-                logger.error(f"Error getting events for {attendee}: {e}")
-                # Still add the attendee with the scheduled event
-                attendee_data.append({
-                    "email": attendee,
-                    "events": [scheduled_event] if selected_slot else []
-                })
-        
         # Make sure we include the requester if they're not already in the attendees list
         requester_email = request_data.get("From")
+        people = list(attendees)
         if requester_email and requester_email not in attendees:
-            try:
-                events = []
-                if requester_email in self.calendar_manager.services:
-                    events = self.calendar_manager.get_events(
-                        requester_email,
-                        time_min=datetime.now(),
-                        time_max=datetime.now() + timedelta(days=7)
-                    )
-                
-                if selected_slot:
-                    events.append(scheduled_event)
-                    
-                attendee_data.append({
-                    "email": requester_email,
-                    "events": events
-                })
-            except Exception as e:
-                logger.error(f"Error getting events for requester {requester_email}: {e}")
-                attendee_data.append({
-                    "email": requester_email,
-                    "events": [scheduled_event] if selected_slot else []
-                })
+            people.append(requester_email)
+        
+        # Reuse the events fetched for the slot search, for everyone with a
+        # loaded calendar; the others were given mock events, so they just
+        # get the scheduled event
+        existing_events = dict(attendee_events or {})
+        if requester_email:
+            existing_events[requester_email] = requester_events or []
+        loaded = self.calendar_manager.services
+        
+        # Add the newly scheduled event to each list if we have a valid slot
+        attendee_data = []
+        for person in people:
+            events = list(existing_events.get(person, [])) if person in loaded else []
+            if selected_slot:
+                events.append(scheduled_event)
+            
+            attendee_data.append({
+                "email": person,
+                "events": events
+            })
         
         # Update the response with the formatted attendee data
         response["Attendees"] = attendee_data
@@ -1,18 +1,116 @@
 """Main scheduler agent implementation using LangGraph."""
 
-from typing import Dict, Any, List, Optional
+import asyncio
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, Iterator, List, Optional, Tuple, TypedDict
 from datetime import datetime, timedelta
 import logging
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph
+from pydantic import TypeAdapter
 
 from ..models.schemas import SchedulingRequest, SchedulingResponse, TimeSlot, Attendee
-from agents.calendar_manager import GoogleCalendarManager
+from .calendar_manager import GoogleCalendarManager
 
 logger = logging.getLogger(__name__)
 
+# Validates raw requests straight from a dict, skipping keyword-argument unpacking
+_REQUEST_ADAPTER = TypeAdapter(SchedulingRequest)
+
+
+class SchedulingState(TypedDict, total=False):
+    """State passed between the nodes of the scheduling workflow."""
+    state: SchedulingRequest
+    # Time the request entered the workflow; search windows are relative to it
+    now: datetime
+    # Earliest free slot found, if any, and the search that found it; the
+    # search is resumed by _handle_conflict to suggest later slots
+    first_slot: Optional[TimeSlot]
+    slots_iter: Iterator[Dict[str, str]]
+    has_availability: bool
+    scheduled_event: Dict[str, Any]
+    scheduled_slot: TimeSlot
+    # ISO start and end of scheduled_slot, formatted once
+    scheduled_slot_iso: Tuple[str, str]
+    suggested_slots: List[TimeSlot]
+    response: SchedulingResponse
+    # Why the request was rejected before any calendar lookups, if it was
+    error: str
+
+
+def _bind_node(method):
+    """Wrap an agent method as a graph node that runs on the invoking agent.
+    
+    The agent is passed in the run's config, so one compiled graph can serve
+    every SchedulerAgent instance.
+    """
+    async def node(data: SchedulingState, config: RunnableConfig) -> SchedulingState:
+        return await method(config["configurable"]["agent"], data)
+    return node
+
+
+@lru_cache(maxsize=None)
+def _compiled_workflow(agent_cls: type):
+    """Create and compile the LangGraph workflow for scheduling, once per agent class."""
+    workflow = StateGraph(SchedulingState)
+    
+    # Define nodes
+    workflow.add_node("parse_request", _bind_node(agent_cls._parse_request))
+    workflow.add_node("check_availability", _bind_node(agent_cls._check_availability))
+    workflow.add_node("schedule_event", _bind_node(agent_cls._schedule_event))
+    workflow.add_node("handle_conflict", _bind_node(agent_cls._handle_conflict))
+    workflow.add_node("generate_response", _bind_node(agent_cls._generate_response))
+    workflow.add_node("early_exit", _bind_node(agent_cls._early_exit))
+    
+    # Define edges
+    workflow.add_conditional_edges(
+        "parse_request",
+        agent_cls._parse_request_decision,
+        {
+            "valid": "check_availability",
+            "invalid": "early_exit"
+        }
+    )
+    workflow.add_conditional_edges(
+        "check_availability",
+        agent_cls._check_availability_decision,
+        {
+            "available": "schedule_event",
+            "conflict": "handle_conflict"
+        }
+    )
+    workflow.add_edge("schedule_event", "generate_response")
+    workflow.add_edge("handle_conflict", "generate_response")
+    
+    # Set entry point
+    workflow.set_entry_point("parse_request")
+    
+    return workflow.compile()
+
+
 class SchedulerAgent:
     """Main agent for handling scheduling requests."""
     
+    # Seconds for which a response is replayed for a retried, identical request
+    SCHEDULE_CACHE_TTL = 300
+    
+    # Maximum number of responses kept for retried requests
+    SCHEDULE_CACHE_SIZE = 1024
+    
+    # Days ahead in which a meeting is booked; later free slots are only suggested
+    SCHEDULE_DAYS = 7
+    
+    # Days ahead searched for free slots to book or suggest
+    SEARCH_DAYS = 14
+    
     def __init__(self, calendar_manager: Optional[GoogleCalendarManager] = None):
         """Initialize the scheduler agent.
         
@@ -20,36 +118,10 @@ class SchedulerAgent:
             calendar_manager: Optional pre-configured GoogleCalendarManager instance
         """
         self.calendar_manager = calendar_manager or GoogleCalendarManager()
-        self.workflow = self._create_workflow()
-    
-    def _create_workflow(self) -> StateGraph:
-        """Create the LangGraph workflow for scheduling."""
-        workflow = StateGraph(SchedulingRequest)
-        
-        # Define nodes
-        workflow.add_node("parse_request", self._parse_request)
-        workflow.add_node("check_availability", self._check_availability)
-        workflow.add_node("schedule_event", self._schedule_event)
-        workflow.add_node("handle_conflict", self._handle_conflict)
-        workflow.add_node("generate_response", self._generate_response)
-        
-        # Define edges
-        workflow.add_edge("parse_request", "check_availability")
-        workflow.add_conditional_edges(
-            "check_availability",
-            self._check_availability_decision,
-            {
-                "available": "schedule_event",
-                "conflict": "handle_conflict"
-            }
-        )
-        workflow.add_edge("schedule_event", "generate_response")
-        workflow.add_edge("handle_conflict", "generate_response")
-        
-        # Set entry point
-        workflow.set_entry_point("parse_request")
-        
-        return workflow.compile()
+        # The compiled graph is shared by all agents of the same class
+        self.workflow = _compiled_workflow(type(self))
+        self._schedule_cache = OrderedDict()
+        self._schedule_cache_lock = threading.Lock()
     
     def schedule(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process a scheduling request.
@@ -61,122 +133,220 @@ class SchedulerAgent:
             Scheduling response
         """
         try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aschedule(request))
+        
+        # Called from inside an event loop (async code, Jupyter), which can't
+        # be re-entered: run the workflow on its own loop in a worker thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(lambda: asyncio.run(self.aschedule(request))).result()
+    
+    async def aschedule(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Process a scheduling request without blocking the event loop.
+        
+        Args:
+            request: Scheduling request data
+            
+        Returns:
+            Scheduling response
+        """
+        try:
+            # Retries of a request that was already scheduled get the same answer
+            cache_key = self._schedule_cache_key(request)
+            response = self._get_cached_response(cache_key)
+            if response is not None:
+                return response
+            
             # Validate and parse request
-            scheduling_request = SchedulingRequest(**request)
+            scheduling_request = _REQUEST_ADAPTER.validate_python(request)
             
             # Execute workflow
-            result = self.workflow.invoke(scheduling_request)
+            result = await self.workflow.ainvoke(
+                {"state": scheduling_request},
+                config={"configurable": {"agent": self}}
+            )
             
-            return result.dict()
+            response = result["response"].model_dump(mode="json")
+            if response["status"] != "error":
+                self._cache_response(cache_key, response)
+            return response
             
         except Exception as e:
-            logger.error(f"Error processing scheduling request: {e}")
+            logger.error("Error processing scheduling request: %s", e)
             return SchedulingResponse(
                 request_id=request.get("request_id", "unknown"),
                 status="error",
                 message=str(e),
                 errors=[str(e)]
-            ).dict()
+            ).model_dump(mode="json")
+    
+    def _schedule_cache_key(self, request: Dict[str, Any]) -> bytes:
+        """Hash the parts of a request that determine its response.
+        
+        The request timestamp is left out, since a retry is stamped anew.
+        """
+        content = {key: value for key, value in request.items() if key != "datetime"}
+        content["attendees"] = sorted(
+            attendee.get("email", "") for attendee in content.get("attendees", ())
+        )
+        return hashlib.blake2b(
+            json.dumps(content, sort_keys=True, default=str).encode(), digest_size=16
+        ).digest()
+    
+    def _get_cached_response(self, cache_key: bytes) -> Optional[Dict[str, Any]]:
+        """Get a copy of a cached response if it is younger than SCHEDULE_CACHE_TTL."""
+        with self._schedule_cache_lock:
+            entry = self._schedule_cache.get(cache_key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.SCHEDULE_CACHE_TTL:
+                del self._schedule_cache[cache_key]
+                return None
+            self._schedule_cache.move_to_end(cache_key)
+            return copy.deepcopy(entry[1])
     
-    def _parse_request(self, state: SchedulingRequest) -> SchedulingRequest:
+    def _cache_response(self, cache_key: bytes, response: Dict[str, Any]):
+        """Store a copy of a response, evicting the least recently used one."""
+        with self._schedule_cache_lock:
+            self._schedule_cache[cache_key] = (time.monotonic(), copy.deepcopy(response))
+            self._schedule_cache.move_to_end(cache_key)
+            if len(self._schedule_cache) > self.SCHEDULE_CACHE_SIZE:
+                self._schedule_cache.popitem(last=False)
+    
+    async def _parse_request(self, data: SchedulingState) -> SchedulingState:
         """Parse and validate the scheduling request."""
+        state = data["state"]
+        
+        # Malformed and repeated emails were dropped when the request was validated
+        if not state.attendees:
+            return {"state": state, "error": "No valid attendee emails in request"}
+        
         # Add the requester to attendees if not already present
         requester_email = state.from_email
-        attendee_emails = {a["email"] for a in state.attendees}
         
-        if requester_email not in attendee_emails:
-            state.attendees.append({"email": requester_email})
+        if requester_email not in state.emails:
+            state.add_attendee(Attendee(email=requester_email))
             
-        return state
+        return {"state": state, "now": datetime.utcnow()}
     
-    def _check_availability(self, state: SchedulingRequest) -> Dict[str, Any]:
-        """Check attendee availability."""
-        attendee_emails = [a["email"] for a in state.attendees]
+    async def _check_availability(self, data: SchedulingState) -> SchedulingState:
+        """Check attendee availability.
         
-        # Find available time slots
-        available_slots = self.calendar_manager.find_available_slots(
-            attendees=attendee_emails,
+        Only the first free slot is searched for; the rest of the search is
+        left to _handle_conflict, which needs it only when that slot is too
+        far out to book.
+        """
+        state = data["state"]
+        now = data["now"]
+        
+        slots_iter = self.calendar_manager.iter_available_slots(
+            attendees=list(state.emails),
             duration_minutes=state.duration_minutes,
-            time_min=datetime.utcnow(),
-            time_max=datetime.utcnow() + timedelta(days=7)
+            time_min=now,
+            time_max=now + timedelta(days=self.SEARCH_DAYS)
         )
+        # The first slot pulls in the calendars, so keep it off the event loop
+        first = await asyncio.to_thread(next, slots_iter, None)
+        first_slot = TimeSlot(**first) if first else None
         
         return {
-            "state": state,
-            "available_slots": available_slots,
-            "has_availability": bool(available_slots)
+            "first_slot": first_slot,
+            "slots_iter": slots_iter,
+            "has_availability": (
+                first_slot is not None
+                and first_slot.start_time < now + timedelta(days=self.SCHEDULE_DAYS)
+            )
         }
     
-    def _check_availability_decision(self, data: Dict[str, Any]) -> str:
+    @staticmethod
+    def _parse_request_decision(data: SchedulingState) -> str:
+        """Determine whether the request is worth checking availability for."""
+        return "invalid" if data.get("error") else "valid"
+    
+    async def _early_exit(self, data: SchedulingState) -> SchedulingState:
+        """Reject an invalid request without calling the calendar API."""
+        return {
+            "response": SchedulingResponse(
+                request_id=data["state"].request_id,
+                status="error",
+                message=data["error"],
+                errors=[data["error"]]
+            )
+        }
+    
+    @staticmethod
+    def _check_availability_decision(data: SchedulingState) -> str:
         """Determine next step based on availability."""
         return "available" if data["has_availability"] else "conflict"
     
-    def _schedule_event(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _schedule_event(self, data: SchedulingState) -> SchedulingState:
         """Schedule the event using the first available slot."""
         state = data["state"]
-        slot = data["available_slots"][0]  # Use first available slot
+        slot = data["first_slot"]
+        start_iso = slot.start_time.isoformat()
+        end_iso = slot.end_time.isoformat()
         
         event_data = {
             "summary": state.subject,
             "description": state.email_content,
             "start": {
-                "dateTime": slot.start_time.isoformat(),
+                "dateTime": start_iso,
                 "timeZone": state.timezone
             },
             "end": {
-                "dateTime": slot.end_time.isoformat(),
+                "dateTime": end_iso,
                 "timeZone": state.timezone
             },
-            "attendees": [{"email": a["email"]} for a in state.attendees],
+            "attendees": [{"email": email} for email in state.emails],
             "location": state.location or ""
         }
         
         # Create the event
-        event = self.calendar_manager.create_event(
+        event = await asyncio.to_thread(
+            self.calendar_manager.create_event,
             user_email=state.from_email,
             event_data=event_data
         )
         
         return {
-            "state": state,
             "scheduled_event": event,
-            "scheduled_slot": slot
+            "scheduled_slot": slot,
+            "scheduled_slot_iso": (start_iso, end_iso)
         }
     
-    def _handle_conflict(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_conflict(self, data: SchedulingState) -> SchedulingState:
         """Handle scheduling conflicts by suggesting alternative times."""
-        state = data["state"]
-        
-        # Find next available slots (wider search)
-        attendee_emails = [a["email"] for a in state.attendees]
-        
-        # Look further ahead for available slots
-        suggested_slots = self.calendar_manager.find_available_slots(
-            attendees=attendee_emails,
-            duration_minutes=state.duration_minutes,
-            time_min=datetime.utcnow() + timedelta(days=1),
-            time_max=datetime.utcnow() + timedelta(days=14)
-        )
+        # Return top 3 suggestions: the first slot found, and the next ones
+        # from the same search, so the calendars are not queried again
+        suggested_slots = []
+        if data["first_slot"] is not None:
+            suggested_slots.append(data["first_slot"])
+            suggested_slots.extend(
+                TimeSlot(**slot) for slot in await asyncio.to_thread(
+                    lambda: list(islice(data["slots_iter"], 2))
+                )
+            )
         
         return {
-            "state": state,
-            "suggested_slots": suggested_slots[:3]  # Return top 3 suggestions
+            "suggested_slots": suggested_slots
         }
     
-    def _generate_response(self, data: Dict[str, Any]) -> SchedulingResponse:
+    async def _generate_response(self, data: SchedulingState) -> SchedulingState:
         """Generate the final response."""
         state = data["state"]
         
         if "scheduled_event" in data:
             # Success case
-            return SchedulingResponse(
+            start_iso, end_iso = data["scheduled_slot_iso"]
+            response = SchedulingResponse(
                 request_id=state.request_id,
                 status="scheduled",
                 message="Meeting successfully scheduled",
                 scheduled_events=[{
-                    "start_time": data["scheduled_slot"].start_time.isoformat(),
-                    "end_time": data["scheduled_slot"].end_time.isoformat(),
-                    "attendees": [a["email"] for a in state.attendees],
+                    "start_time": start_iso,
+                    "end_time": end_iso,
+                    "attendees": list(state.emails),
                     "summary": state.subject
                 }]
             )
@@ -190,9 +360,11 @@ class SchedulerAgent:
                 for slot in data.get("suggested_slots", [])
             ]
             
-            return SchedulingResponse(
+            response = SchedulingResponse(
                 request_id=state.request_id,
                 status="conflict",
                 message="No available slots found. Here are some suggested times:",
                 suggested_times=suggested_times
             )
+        
+        return {"response": response}
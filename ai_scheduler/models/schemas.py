@@ -1,8 +1,12 @@
 """Data models and schemas for the AI Scheduling Assistant."""
 
+import re
 from datetime import datetime
-from typing import Dict, List, Optional
-from pydantic import BaseModel, Field, validator
+from typing import Dict, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationInfo, field_validator
+
+# Loose shape check for email addresses: one @ and a dot in the domain
+_EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
 
 class Attendee(BaseModel):
     """Represents a meeting attendee."""
@@ -16,9 +20,10 @@ class TimeSlot(BaseModel):
     end_time: datetime
     timezone: str = "UTC"
 
-    @validator('end_time')
-    def end_time_must_be_after_start_time(cls, v, values):
-        if 'start_time' in values and v <= values['start_time']:
+    @field_validator('end_time')
+    @classmethod
+    def end_time_must_be_after_start_time(cls, v: datetime, info: ValidationInfo) -> datetime:
+        if 'start_time' in info.data and v <= info.data['start_time']:
             raise ValueError('end_time must be after start_time')
         return v
 
@@ -38,7 +43,7 @@ class SchedulingRequest(BaseModel):
     datetime: str = Field(..., description="ISO 8601 timestamp of the request")
     location: Optional[str] = Field(None, description="Meeting location")
     from_email: str = Field(..., description="Email of the requester")
-    attendees: List[Dict[str, str]] = Field(
+    attendees: List[Attendee] = Field(
         default_factory=list,
         description="List of attendees with their emails"
     )
@@ -46,6 +51,38 @@ class SchedulingRequest(BaseModel):
     email_content: str = Field(..., description="Content of the scheduling email")
     duration_minutes: int = Field(30, description="Duration of the meeting in minutes")
     timezone: str = Field("UTC", description="Timezone for the meeting")
+    
+    _emails: Optional[Tuple[str, ...]] = PrivateAttr(default=None)
+    
+    @field_validator('duration_minutes')
+    @classmethod
+    def duration_must_be_positive(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError('duration_minutes must be positive')
+        return v
+    
+    @field_validator('attendees')
+    @classmethod
+    def clean_attendees(cls, v: List[Attendee]) -> List[Attendee]:
+        # Drop malformed emails, and repeated ones (e.g. overlapping To and
+        # Cc) so each calendar is only looked up once; order is kept
+        unique = {}
+        for attendee in v:
+            if _EMAIL_RE.fullmatch(attendee.email):
+                unique.setdefault(attendee.email, attendee)
+        return list(unique.values())
+    
+    @property
+    def emails(self) -> Tuple[str, ...]:
+        """Attendee emails, in order; computed once and reused."""
+        if self._emails is None:
+            self._emails = tuple(attendee.email for attendee in self.attendees)
+        return self._emails
+    
+    def add_attendee(self, attendee: Attendee):
+        """Add an attendee, keeping the cached email list up to date."""
+        self.attendees.append(attendee)
+        self._emails = None
 
 class SchedulingResponse(BaseModel):
     """Output schema for scheduling responses."""
@@ -56,8 +93,8 @@ class SchedulingResponse(BaseModel):
     suggested_times: Optional[List[Dict]] = None
     errors: Optional[List[str]] = None
 
-    model_config = {
-        "json_schema_extra": {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "request_id": "6118b54f-907b-4451-8d48-dd13d76033a5",
                 "status": "scheduled",
@@ -72,4 +109,4 @@ class SchedulingResponse(BaseModel):
                 ]
             }
         }
-    }
+    )
@@ -1,13 +1,24 @@
-from flask import Flask, request, jsonify
-from threading import Thread
+from fastapi import Body, FastAPI, Response
+import uvicorn
+import asyncio
 import json
 import os
+import re
 import sys
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
+from typing import Any, Dict
 import uuid
-from openai import OpenAI  # Use OpenAI client to connect to vLLM
-import time 
+
+try:
+    # C implementation, several times faster than the standard library
+    import orjson
+    
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode()
 
 logging.basicConfig(
     level=logging.INFO,
@@ -22,12 +33,6 @@ BASE_URL = "http://localhost:3000/v1"
 # Define the model path
 MODEL_PATH = "/home/user/Models/deepseek-ai/deepseek-llm-7b-chat"
 
-# Set up the OpenAI client with the vLLM server
-client = OpenAI(
-    api_key="abc-123",  # API key set when starting vLLM server
-    base_url=BASE_URL
-)
-
 # Add the current directory to path to ensure imports work
 current_dir = os.getcwd()
 if current_dir not in sys.path:
@@ -36,7 +41,7 @@ if current_dir not in sys.path:
 # Check token files
 if os.path.exists('Keys'):
     files = os.listdir('Keys')
-    logger.info(f"Files in Keys directory: {files}")
+    logger.info("Files in Keys directory: %s", files)
 else:
     logger.error("Keys directory not found!")
 
@@ -45,8 +50,13 @@ from ai_scheduler.agents.scheduler_agent import SchedulerAgent
 from ai_scheduler.agents.llm_service import LLMService
 from ai_scheduler.agents.calendar_manager import GoogleCalendarManager
 
-app = Flask(__name__)
-received_data = []
+app = FastAPI()
+
+# Separators between addresses in a request's "To" field
+_EMAIL_SPLIT = re.compile(r'[,\s]+')
+
+# Requests being processed, by Request_id, so concurrent retries share one run
+_inflight: Dict[str, asyncio.Task] = {}
 
 # Initialize services with the model path
 llm_service = LLMService(
@@ -55,8 +65,58 @@ llm_service = LLMService(
 )
 
 calendar_manager = GoogleCalendarManager(token_dir='Keys')
+# Load every token and build its service now, so the first requests don't pay for it
+calendar_manager.load_all_credentials()
 scheduler_agent = SchedulerAgent(calendar_manager=calendar_manager)
 
+def _scheduler_request(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a raw meeting request for the SchedulerAgent."""
+    # Repeated addresses would only make the calendar lookups bigger
+    emails = dict.fromkeys(email for email in _EMAIL_SPLIT.split(data.get("To", "")) if email)
+    return {
+        "request_id": data.get("Request_id", str(uuid.uuid4())),
+        "datetime": datetime.utcnow().isoformat(),
+        "from_email": data.get("From", ""),
+        "attendees": [{"email": email} for email in emails],
+        "subject": data.get("Subject", ""),
+        "email_content": data.get("Body", ""),
+        "duration_minutes": 30,  # Default, will be updated by LLM
+        "timezone": "UTC"
+    }
+
+def _formatted_response(data: Dict[str, Any], response: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a SchedulerAgent response to match the expected output format."""
+    formatted_response = {
+        "Request_id": data.get("Request_id", ""),
+        "From": data.get("From", ""),
+        "To": data.get("To", ""),
+        "Subject": data.get("Subject", ""),
+        "Body": data.get("Body", ""),
+        "EventStart": response.get("scheduled_event", {}).get("start", {}).get("dateTime", ""),
+        "EventEnd": response.get("scheduled_event", {}).get("end", {}).get("dateTime", ""),
+        "Duration_mins": data.get("Duration_mins", 30),
+        "MetaData": response
+    }
+    
+    logger.info("Meeting scheduled: %s", formatted_response.get('EventStart'))
+    return formatted_response
+
+def _error_response(data: Dict[str, Any], e: Exception) -> Dict[str, Any]:
+    """Build a minimal valid response for a request that failed."""
+    logger.error("Error in meeting assistant: %s", e)
+    logger.exception("Exception details:")
+    
+    # If there's an error, return a minimal valid response
+    response = data.copy()
+    
+    # Add required fields
+    response["EventStart"] = ""
+    response["EventEnd"] = ""
+    response["Duration_mins"] = ""
+    response["MetaData"] = {"error": str(e)}
+    
+    return response
+
 def your_meeting_assistant(data): 
     """
     Process the meeting request and schedule a meeting using the SchedulerAgent.
@@ -68,76 +128,77 @@ def your_meeting_assistant(data):
         Scheduled meeting data in the expected format
     """
     try:
-        logger.info(f"Processing meeting request: {data.get('Request_id')}")
-        
-        # Format the request for SchedulerAgent
-        request_data = {
-            "request_id": data.get("Request_id", str(uuid.uuid4())),
-            "datetime": datetime.utcnow().isoformat(),
-            "from_email": data.get("From", ""),
-            "attendees": [{"email": email.strip()} for email in data.get("To", "").split(",") if email.strip()],
-            "subject": data.get("Subject", ""),
-            "email_content": data.get("Body", ""),
-            "duration_minutes": 30,  # Default, will be updated by LLM
-            "timezone": "UTC"
-        }
+        logger.info("Processing meeting request: %s", data.get('Request_id'))
         
         # Use the scheduler agent to process the request
-        response = scheduler_agent.schedule(request_data)
-        
-        # Format the response to match the expected format
-        formatted_response = {
-            "Request_id": data.get("Request_id", ""),
-            "From": data.get("From", ""),
-            "To": data.get("To", ""),
-            "Subject": data.get("Subject", ""),
-            "Body": data.get("Body", ""),
-            "EventStart": response.get("scheduled_event", {}).get("start", {}).get("dateTime", ""),
-            "EventEnd": response.get("scheduled_event", {}).get("end", {}).get("dateTime", ""),
-            "Duration_mins": data.get("Duration_mins", 30),
-            "MetaData": response
-        }
-        
-        logger.info(f"Meeting scheduled: {formatted_response.get('EventStart')}")
-        return formatted_response
+        response = scheduler_agent.schedule(_scheduler_request(data))
+        return _formatted_response(data, response)
         
     except Exception as e:
-        logger.error(f"Error in meeting assistant: {e}")
-        logger.exception("Exception details:")
+        return _error_response(data, e)
+
+async def your_meeting_assistant_async(data):
+    """
+    Process the meeting request without blocking the server's event loop.
+    
+    Args:
+        data: Meeting request data
         
-        # If there's an error, return a minimal valid response
-        response = data.copy()
+    Returns:
+        Scheduled meeting data in the expected format
+    """
+    try:
+        logger.info("Processing meeting request: %s", data.get('Request_id'))
         
-        # Add required fields
-        response["EventStart"] = ""
-        response["EventEnd"] = ""
-        response["Duration_mins"] = ""
-        response["MetaData"] = {"error": str(e)}
+        # Use the scheduler agent to process the request
+        response = await scheduler_agent.aschedule(_scheduler_request(data))
+        return _formatted_response(data, response)
         
-        return response
-
-@app.route('/receive', methods=['POST'])
-def receive():
-    data = request.get_json()
-    print(f"\n Received: {json.dumps(data, indent=2)}")
-    print(f"\n\n\n Sending:\n {json.dumps(new_data, indent=2)}")
-    return jsonify(new_data)
+    except Exception as e:
+        return _error_response(data, e)
 
-def run_flask():
-    app.run(host='0.0.0.0', port=5000)
+async def _single_flight_meeting_assistant(data):
+    """
+    Process a meeting request, joining the run already in flight for its Request_id.
+    
+    Args:
+        data: Meeting request data
+        
+    Returns:
+        Scheduled meeting data in the expected format
+    """
+    request_id = data.get("Request_id")
+    if not request_id:
+        return await your_meeting_assistant_async(data)
+    
+    task = _inflight.get(request_id)
+    if task is None:
+        task = asyncio.ensure_future(your_meeting_assistant_async(data))
+        _inflight[request_id] = task
+        task.add_done_callback(lambda _: _inflight.pop(request_id, None))
+    
+    # Shielded, so a caller that disconnects doesn't cancel the others' run
+    return await asyncio.shield(task)
+
+@app.post('/receive')
+async def receive(data: Dict[str, Any] = Body(...)):
+    # Pretty-printing whole payloads is costly, so only do it when debugging
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Received: %s", _dumps(data, indent=True).decode())
+    new_data = await _single_flight_meeting_assistant(data)
+    
+    # Serialise once, rather than letting FastAPI re-encode the whole dict
+    body = _dumps(new_data)
+    if debug:
+        logger.debug("Sending: %s", _dumps(new_data, indent=True).decode())
+    return Response(content=body, media_type="application/json")
 
 if __name__ == "__main__":
-    # Start Flask in a background thread
-    Thread(target=run_flask, daemon=True).start()
-
-    # Keep the program running
-    print("Flask server is running on http://0.0.0.0:5000")
+    # One process, on its own event loop (uvloop when installed), serves
+    # many requests while they wait on the LLM and calendars. It stays a
+    # single worker because the single-flight map and the retry cache only
+    # de-duplicate requests within one process
+    print("Server is running on http://0.0.0.0:5000")
     print("Press Ctrl+C to stop the server")
-
-    # This will keep the process running
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        print("Server shutting down...")
-        sys.exit(0)
\ No newline at end of file
+    uvicorn.run("service_my:app", host='0.0.0.0', port=5000, loop="auto")